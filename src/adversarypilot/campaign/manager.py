@@ -22,7 +22,7 @@ from adversarypilot.prioritizer.engine import PrioritizerEngine
 from adversarypilot.replay.recorder import SnapshotRecorder
 from adversarypilot.replay.snapshot import DecisionSnapshot
 from adversarypilot.taxonomy.registry import TechniqueRegistry
-from adversarypilot.utils.hashing import derive_comparable_group_key, hash_target_profile
+from adversarypilot.utils.hashing import derive_comparable_group_keys, hash_target_profile
 from adversarypilot.utils.timestamps import utc_now
 
 logger = logging.getLogger(__name__)
@@ -170,6 +170,57 @@ class CampaignManager:
             len(attempts), len(evaluations), campaign_id,
         )
 
+        self._apply_results(campaign, attempts, evaluations)
+        self._save(campaign)
+        return campaign
+
+    def ingest_results_many(
+        self,
+        campaign_id: str,
+        attempts_list: list[list[AttemptResult]],
+        evaluations_list: list[list[EvaluationResult]],
+    ) -> Campaign:
+        """Add several result batches to a campaign, persisting it once.
+
+        Batches are applied in order exactly as by repeated ingest_results()
+        calls, including one posterior update per batch, but the campaign is
+        serialized and written only after the last one.
+
+        Args:
+            campaign_id: Campaign identifier
+            attempts_list: Attempt result batches
+            evaluations_list: Evaluation result batches, parallel to attempts_list
+
+        Returns:
+            Updated campaign
+        """
+        if len(attempts_list) != len(evaluations_list):
+            raise ValueError(
+                f"Got {len(attempts_list)} attempt batches but "
+                f"{len(evaluations_list)} evaluation batches"
+            )
+
+        campaign = self.get(campaign_id)
+        if campaign is None:
+            raise ValueError(f"Campaign {campaign_id} not found")
+
+        logger.info(
+            "Ingesting %d result batches into campaign %s",
+            len(attempts_list), campaign_id,
+        )
+
+        for attempts, evaluations in zip(attempts_list, evaluations_list):
+            self._apply_results(campaign, attempts, evaluations)
+        self._save(campaign)
+        return campaign
+
+    def _apply_results(
+        self,
+        campaign: Campaign,
+        attempts: list[AttemptResult],
+        evaluations: list[EvaluationResult],
+    ) -> None:
+        """Apply one batch of results to an in-memory campaign."""
         campaign.state.attempts.extend(attempts)
         campaign.state.evaluations.extend(evaluations)
 
@@ -183,11 +234,9 @@ class CampaignManager:
         campaign.state.last_updated = utc_now()
 
         # Populate comparable_group_key for each evaluation
-        for evaluation in evaluations:
-            if not evaluation.comparability.comparable_group_key:
-                evaluation.comparability.comparable_group_key = derive_comparable_group_key(
-                    evaluation.comparability
-                )
+        unkeyed = [e.comparability for e in evaluations if not e.comparability.comparable_group_key]
+        for comparability, key in zip(unkeyed, derive_comparable_group_keys(unkeyed)):
+            comparability.comparable_group_key = key
 
         # Update posteriors if adaptive campaign
         is_adaptive = campaign.metadata.get("adaptive", False)
@@ -199,9 +248,6 @@ class CampaignManager:
                 campaign.target,
             )
 
-        self._save(campaign)
-        return campaign
-
     def recommend_next(
         self,
         campaign_id: str,
@@ -96,16 +96,35 @@ def report(
     ),
     format: str = typer.Option("terminal", "--format", "-f", help="Output format: terminal, markdown, json, html"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Write report to file"),
+    sections: Optional[str] = typer.Option(
+        None, "--sections", help="Comma-separated HTML report sections to include (default: all)"
+    ),
 ) -> None:
     """Generate a defender report for a campaign."""
     from adversarypilot.campaign.manager import CampaignManager
     from adversarypilot.reporting.analyzer import WeakestLayerAnalyzer
     from adversarypilot.reporting.comparability import ComparabilityChecker
     from adversarypilot.reporting.renderer import ReportRenderer
-    from adversarypilot.reporting.html_renderer import HtmlReportRenderer
+    from adversarypilot.reporting.html_renderer import REPORT_SECTIONS, HtmlReportRenderer
     from adversarypilot.models.report import DefenderReport
     from adversarypilot.taxonomy.registry import TechniqueRegistry
 
+    # Reject bad HTML options before loading and analyzing the campaign
+    selected = None
+    if format == "html":
+        if not output:
+            console.print("[yellow]HTML format requires --output/-o path[/yellow]")
+            raise typer.Exit(1)
+        if sections is not None:
+            selected = {name.strip() for name in sections.split(",") if name.strip()}
+            if not selected:
+                raise typer.BadParameter("no section names given", param_hint="--sections")
+            unknown = selected - set(REPORT_SECTIONS)
+            if unknown:
+                raise typer.BadParameter(
+                    f"unknown sections: {', '.join(sorted(unknown))}", param_hint="--sections"
+                )
+
     manager = CampaignManager(storage_dir=storage_dir)
     campaign = manager.get(campaign_id)
     if campaign is None:
@@ -140,10 +159,9 @@ def report(
 
     if format == "html":
         html_renderer = HtmlReportRenderer(registry)
-        text = html_renderer.render(report_obj, campaign, output_path=output)
-        if not output:
-            console.print("[yellow]HTML format requires --output/-o path[/yellow]")
-            raise typer.Exit(1)
+        html_renderer.render(
+            report_obj, campaign, output_path=output, return_str=False, sections=selected
+        )
         console.print(f"[green]HTML report written to {output}[/green]")
         return
 
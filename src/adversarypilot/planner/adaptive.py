@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import logging
 import math
 import random
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -29,6 +31,21 @@ from adversarypilot.taxonomy.registry import TechniqueRegistry
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _load_default_config() -> dict[str, Any]:
+    """Parse the packaged prioritizer config once per process.
+
+    The returned dict is shared between callers; take a copy before use.
+    """
+    from importlib import resources
+
+    with resources.files("adversarypilot.prioritizer").joinpath("config.yaml").open() as f:
+        data = yaml.safe_load(f)
+    if not isinstance(data, dict):
+        raise TypeError(f"Packaged prioritizer config must be a mapping, got {type(data).__name__}")
+    return data
+
+
 class AdaptivePlanner:
     """Hybrid Thompson Sampling + V1 rule-based planner.
 
@@ -58,10 +75,7 @@ class AdaptivePlanner:
 
         # Load config
         if config_path is None:
-            from importlib import resources
-
-            with resources.files("adversarypilot.prioritizer").joinpath("config.yaml").open() as f:
-                self.config = yaml.safe_load(f)
+            self.config = copy.deepcopy(_load_default_config())
         else:
             with open(config_path) as f:
                 self.config = yaml.safe_load(f)
@@ -9,6 +9,7 @@ to have correlated success rates against the same target.
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Sequence
 
 from adversarypilot.models.technique import AttackTechnique
 from adversarypilot.planner.posterior import PosteriorState
@@ -22,7 +23,7 @@ class FamilyCorrelation:
         self._families: dict[str, set[str]] = defaultdict(set)
         self._id_to_family: dict[str, str] = {}
 
-    def register_techniques(self, catalog: list[AttackTechnique]) -> None:
+    def register_techniques(self, catalog: Sequence[AttackTechnique]) -> None:
         """Build family index from technique catalog."""
         self._families.clear()
         self._id_to_family.clear()
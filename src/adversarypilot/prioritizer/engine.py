@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -157,7 +158,7 @@ class PrioritizerEngine:
         )
 
     def _apply_hard_filters(
-        self, techniques: list[AttackTechnique], target: TargetProfile
+        self, techniques: Sequence[AttackTechnique], target: TargetProfile
     ) -> list[AttackTechnique]:
         """Eliminate techniques that fail hard filter predicates."""
         max_cost = self._config.get("filters", {}).get("max_cost", 1.0)
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import uuid
 from pathlib import Path
 
@@ -64,8 +63,9 @@ class SnapshotRecorder:
         if not path.exists():
             return None
 
-        data = json.loads(path.read_text())
-        return DecisionSnapshot.model_validate(data)
+        # Parse straight into the model with pydantic-core's JSON parser
+        # rather than building an intermediate dict with json.loads()
+        return DecisionSnapshot.model_validate_json(path.read_bytes())
 
     def list_snapshots(self, campaign_id: str) -> list[int]:
         """List all snapshot step numbers for a campaign.
@@ -6,9 +6,11 @@ controls. Computes per-framework coverage and identifies untested controls.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from adversarypilot.models.enums import Goal
+from adversarypilot.models.technique import AttackTechnique
 from adversarypilot.taxonomy.registry import TechniqueRegistry
 
 
@@ -146,7 +148,7 @@ class ComplianceAnalyzer:
         self,
         framework: str,
         controls: dict[str, str],
-        catalog: list,
+        catalog: Sequence[AttackTechnique],
         tried: set[str],
         success_map: dict[str, bool],
     ) -> ComplianceSummary:
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from adversarypilot.models.enums import Goal, Phase, Surface
+from adversarypilot.models.technique import AttackTechnique
 from adversarypilot.taxonomy.registry import TechniqueRegistry
 
 
@@ -83,7 +85,7 @@ class CoverageAnalyzer:
 
     def _check_surface_coverage(
         self,
-        catalog: list,
+        catalog: Sequence[AttackTechnique],
         tried: set[str],
         gaps: list[CoverageGap],
     ) -> dict[str, float]:
@@ -117,7 +119,7 @@ class CoverageAnalyzer:
 
     def _check_goal_coverage(
         self,
-        catalog: list,
+        catalog: Sequence[AttackTechnique],
         tried: set[str],
         goals: list[Goal],
         gaps: list[CoverageGap],
@@ -127,13 +129,13 @@ class CoverageAnalyzer:
         goal_tested: dict[str, int] = {g.value: 0 for g in goals}
 
         for t in catalog:
-            for g in t.goals_supported:
-                if g in goals:
-                    goal_techniques[g.value].append(t.id)
+            for supported in t.goals_supported:
+                if supported in goals:
+                    goal_techniques[supported.value].append(t.id)
                     if t.id in tried:
-                        goal_tested[g.value] += 1
+                        goal_tested[supported.value] += 1
 
-        coverage = {}
+        coverage: dict[str, float] = {}
         for goal in goals:
             g = goal.value
             total = len(goal_techniques[g])
@@ -154,7 +156,7 @@ class CoverageAnalyzer:
 
     def _check_phase_coverage(
         self,
-        catalog: list,
+        catalog: Sequence[AttackTechnique],
         tried: set[str],
         gaps: list[CoverageGap],
     ) -> dict[str, float]:
@@ -187,7 +189,7 @@ class CoverageAnalyzer:
 
     def _check_atlas_coverage(
         self,
-        catalog: list,
+        catalog: Sequence[AttackTechnique],
         tried: set[str],
         gaps: list[CoverageGap],
     ) -> float:
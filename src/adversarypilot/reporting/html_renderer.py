@@ -4,14 +4,86 @@ from __future__ import annotations
 
 import json
 from collections import defaultdict
+from datetime import datetime
+from itertools import combinations
 from pathlib import Path
+from typing import Any
 
 from adversarypilot.models.campaign import Campaign
 from adversarypilot.models.enums import Surface
 from adversarypilot.models.report import DefenderReport
+from adversarypilot.models.results import EvaluationResult
 from adversarypilot.reporting.html_template import HTML_TEMPLATE
 from adversarypilot.taxonomy.registry import TechniqueRegistry
 
+# Split once at import so render() can stream the payload between the two halves
+_TEMPLATE_PREFIX, _TEMPLATE_SUFFIX = HTML_TEMPLATE.split("{{DATA_JSON}}", 1)
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Top-level payload sections that can be selected via render(sections=...).
+# The "report" header block is always included.
+REPORT_SECTIONS = (
+    "graph",
+    "layers",
+    "heatmap",
+    "techniques",
+    "atlas_mapping",
+    "statistics",
+    "sensitivity",
+    "posterior_evolution",
+    "coverage",
+    "compliance",
+)
+
+# Attack phase ordering used to direct graph edges (unknown phases sort as exploit)
+_PHASE_ORDER = {"recon": 0, "probe": 1, "exploit": 2, "persistence": 3, "evaluation": 4}
+
+
+def _build_graph_edges(
+    ids: list[str], masks: list[int], phases: list[int], bit_to_atlas: list[str]
+) -> list[dict]:
+    """Build directed edges between nodes whose ATLAS bitmasks intersect.
+
+    The O(N^2) pair loop works only on flat per-node lists, so no dicts are
+    touched until an edge is actually emitted. Edges point from the earlier
+    phase to the later one.
+    """
+    edges = []
+    edge_id = 0
+    edge_set: set[tuple[int, int]] = set()
+
+    for (i, n1), (j, n2) in combinations(enumerate(ids), 2):
+        shared = masks[i] & masks[j]
+        if shared:
+            # Direct edge from earlier phase to later phase
+            if phases[i] <= phases[j]:
+                src, tgt, key = n1, n2, (i, j)
+            else:
+                src, tgt, key = n2, n1, (j, i)
+            if key not in edge_set:
+                edge_set.add(key)
+                edges.append({
+                    "id": f"edge-{edge_id}",
+                    "source": src,
+                    "target": tgt,
+                    "atlas_id": bit_to_atlas[(shared & -shared).bit_length() - 1],
+                })
+                edge_id += 1
+
+    return edges
+
+
+def _json_default(obj: object) -> str:
+    """Serialize values the json module cannot encode natively.
+
+    Every datetime in the payload is written as ISO-8601 ("T" separator),
+    which the template's ``new Date(...)`` parses. Anything else goes
+    through str().
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
 
 class HtmlReportRenderer:
     """Renders defender reports as self-contained HTML with attack graph visualization."""
@@ -26,38 +98,86 @@ class HtmlReportRenderer:
         report: DefenderReport,
         campaign: Campaign,
         output_path: Path | str | None = None,
-    ) -> str:
+        return_str: bool = True,
+        pretty: bool = False,
+        sections: set[str] | None = None,
+    ) -> str | None:
         """Render report as self-contained HTML.
 
+        With ``output_path`` and ``return_str=False``, the JSON payload is
+        encoded incrementally and streamed to disk between the template halves
+        through a buffered writer, so neither the payload nor the document is
+        ever held in memory as one string.
+
         Args:
             report: Defender report to render
             campaign: Campaign with attempt/evaluation data
             output_path: Optional path to write HTML file
+            return_str: Build and return the HTML string (set False for
+                file-only batch rendering)
+            pretty: Indent the embedded JSON payload for human inspection
+            sections: Subset of REPORT_SECTIONS to populate (default: all).
+                Unselected sections are emitted as null and their builders
+                are skipped entirely.
 
         Returns:
-            HTML string
+            HTML string, or None when return_str is False
         """
-        data = self._build_data_payload(report, campaign)
-        html = HTML_TEMPLATE.replace("{{DATA_JSON}}", json.dumps(data, indent=2, default=str))
+        data = self._build_data_payload(report, campaign, sections)
+        if pretty:
+            encoder = json.JSONEncoder(indent=2, default=_json_default)
+        else:
+            encoder = json.JSONEncoder(separators=(",", ":"), default=_json_default)
+
+        # The payload sits in a <script type="application/json"> block; "<\/" is
+        # a valid JSON escape that keeps "</script>" in any string from closing it.
+        if not return_str:
+            if output_path:
+                # iterencode() yields every string and key as part of a single
+                # chunk, so a "</" never straddles two chunks.
+                with open(
+                    output_path, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE
+                ) as f:
+                    f.write(_TEMPLATE_PREFIX)
+                    f.writelines(chunk.replace("</", "<\\/") for chunk in encoder.iterencode(data))
+                    f.write(_TEMPLATE_SUFFIX)
+            return None
 
+        payload = encoder.encode(data).replace("</", "<\\/")
+        html = _TEMPLATE_PREFIX + payload + _TEMPLATE_SUFFIX
         if output_path:
-            Path(output_path).write_text(html)
-
+            with open(output_path, "w", encoding="utf-8", newline="") as f:
+                f.write(html)
         return html
 
     def _build_data_payload(
-        self, report: DefenderReport, campaign: Campaign
+        self,
+        report: DefenderReport,
+        campaign: Campaign,
+        sections: set[str] | None = None,
     ) -> dict:
-        """Build comprehensive data payload for visualization."""
-        techniques_data = self._build_techniques(report, campaign)
-        graph_data = self._build_graph(techniques_data)
-        layers_data = self._build_layers(report)
-        heatmap_data = self._build_heatmap(campaign)
-        atlas_data = self._build_atlas_mapping(techniques_data)
-        statistics = self._build_statistics(report, campaign, techniques_data)
+        """Build comprehensive data payload for visualization.
 
-        sensitivity_data = self._build_sensitivity(campaign)
-        posterior_evolution = self._build_posterior_evolution(campaign)
+        Args:
+            report: Defender report to render
+            campaign: Campaign with attempt/evaluation data
+            sections: Subset of REPORT_SECTIONS to build (default: all)
+
+        Raises:
+            ValueError: If sections contains an unknown name
+        """
+        if sections is None:
+            sections = set(REPORT_SECTIONS)
+        else:
+            unknown = set(sections) - set(REPORT_SECTIONS)
+            if unknown:
+                raise ValueError(f"Unknown report sections: {', '.join(sorted(unknown))}")
+
+        techniques_data: list[dict[str, Any]] = (
+            self._build_techniques(report, campaign)
+            if sections & {"techniques", "graph", "atlas_mapping", "statistics"}
+            else []
+        )
 
         return {
             "report": {
@@ -65,32 +185,42 @@ class HtmlReportRenderer:
                 "campaign_id": report.campaign_id,
                 "target_name": report.target_profile.name,
                 "target_type": report.target_profile.target_type.value,
-                "generated_at": report.generated_at.isoformat(),
+                "generated_at": report.generated_at,
                 "primary_weak_layer": report.primary_weak_layer.value if report.primary_weak_layer else None,
-                "secondary_weak_layers": [s.value for s in report.secondary_weak_layers],
+                "secondary_weak_layers": tuple(s.value for s in report.secondary_weak_layers),
                 "overall_risk_summary": report.overall_risk_summary,
                 "comparability_warnings": report.comparability_warnings,
                 "next_recommended_tests": report.next_recommended_tests,
             },
-            "graph": graph_data,
-            "layers": layers_data,
-            "heatmap": heatmap_data,
-            "techniques": techniques_data,
-            "atlas_mapping": atlas_data,
-            "statistics": statistics,
-            "sensitivity": sensitivity_data,
-            "posterior_evolution": posterior_evolution,
+            "graph": self._build_graph(techniques_data) if "graph" in sections else None,
+            "layers": self._build_layers(report) if "layers" in sections else None,
+            "heatmap": self._build_heatmap(campaign) if "heatmap" in sections else None,
+            "techniques": techniques_data if "techniques" in sections else None,
+            "atlas_mapping": (
+                self._build_atlas_mapping(techniques_data) if "atlas_mapping" in sections else None
+            ),
+            "statistics": (
+                self._build_statistics(report, campaign, techniques_data)
+                if "statistics" in sections else None
+            ),
+            "sensitivity": self._build_sensitivity(campaign) if "sensitivity" in sections else None,
+            "posterior_evolution": (
+                self._build_posterior_evolution(campaign)
+                if "posterior_evolution" in sections else None
+            ),
             "coverage": {
                 "atlas_coverage": report.atlas_coverage,
                 "gaps": report.coverage_gaps,
-            },
-            "compliance": self._build_compliance(report),
+            } if "coverage" in sections else None,
+            "compliance": self._build_compliance(report) if "compliance" in sections else None,
         }
 
     def _build_techniques(self, report: DefenderReport, campaign: Campaign) -> list[dict]:
         """Build detailed technique list with outcomes."""
         techniques = []
         seen_ids = set()
+        best_evaluations = self._index_best_evaluations(campaign)
+        tech_map = self.registry.get_all_by_id()
 
         for assessment in report.layer_assessments:
             for tech_id in assessment.techniques_tested:
@@ -98,11 +228,11 @@ class HtmlReportRenderer:
                     continue
                 seen_ids.add(tech_id)
 
-                technique = self.registry.get(tech_id)
+                technique = tech_map.get(tech_id)
                 if not technique:
                     continue
 
-                evaluation = self._find_evaluation(campaign, tech_id)
+                evaluation = best_evaluations.get(tech_id)
 
                 tech_data = {
                     "id": tech_id,
@@ -138,9 +268,10 @@ class HtmlReportRenderer:
 
     def _build_graph(self, techniques: list[dict]) -> dict:
         """Build graph nodes and edges from techniques."""
-        nodes = []
-        for t in techniques:
-            nodes.append({
+        # Nodes are emitted as-is into the JSON payload, so they stay plain
+        # dicts; the edge pass below works on flat per-node lists instead
+        nodes = [
+            {
                 "id": t["id"],
                 "label": t["name"],
                 "domain": t["domain"],
@@ -150,36 +281,24 @@ class HtmlReportRenderer:
                 "success": t["success"],
                 "score": t["score"],
                 "atlas_refs": t["atlas_refs"],
-            })
+            }
+            for t in techniques
+        ]
 
         # Build edges: connect techniques that share ATLAS refs
-        # Use directed edges based on phase ordering for meaningful flow
-        phase_order = {"recon": 0, "probe": 1, "exploit": 2, "persistence": 3, "evaluation": 4}
-        edges = []
-        edge_id = 0
-        edge_set = set()
-
-        for i, n1 in enumerate(nodes):
-            for j, n2 in enumerate(nodes):
-                if i >= j:
-                    continue
-                shared_atlas = set(n1["atlas_refs"]) & set(n2["atlas_refs"])
-                if shared_atlas:
-                    # Direct edge from earlier phase to later phase
-                    p1 = phase_order.get(n1.get("phase", ""), 2)
-                    p2 = phase_order.get(n2.get("phase", ""), 2)
-                    src = n1["id"] if p1 <= p2 else n2["id"]
-                    tgt = n2["id"] if p1 <= p2 else n1["id"]
-                    key = f"{src}:{tgt}"
-                    if key not in edge_set:
-                        edge_set.add(key)
-                        edges.append({
-                            "id": f"edge-{edge_id}",
-                            "source": src,
-                            "target": tgt,
-                            "atlas_id": sorted(shared_atlas)[0],
-                        })
-                        edge_id += 1
+        # One bit per ATLAS ID, assigned in sorted order so the lowest set bit
+        # of a shared mask is the lexicographically smallest shared ID
+        bit_to_atlas = sorted({ref for n in nodes for ref in n["atlas_refs"]})
+        atlas_to_bit = {atlas_id: 1 << i for i, atlas_id in enumerate(bit_to_atlas)}
+        masks = []
+        for n in nodes:
+            mask = 0
+            for ref in n["atlas_refs"]:
+                mask |= atlas_to_bit[ref]
+            masks.append(mask)
+        phases = [_PHASE_ORDER.get(n.get("phase", ""), 2) for n in nodes]
+
+        edges = _build_graph_edges([n["id"] for n in nodes], masks, phases, bit_to_atlas)
 
         return {"nodes": nodes, "edges": edges}
 
@@ -187,18 +306,20 @@ class HtmlReportRenderer:
         """Build layer assessment data."""
         layers = []
         for assessment in report.layer_assessments:
+            ev = assessment.evidence
+            tested = assessment.techniques_tested
             layers.append({
                 "layer": assessment.layer.value,
                 "risk_score": assessment.risk_score,
                 "is_primary_weakness": assessment.is_primary_weakness,
-                "success_rate": assessment.evidence.smoothed_success_rate,
-                "confidence_interval": list(assessment.evidence.confidence_interval),
-                "techniques_tested": len(assessment.techniques_tested),
-                "technique_ids": assessment.techniques_tested,
-                "evidence_quality": assessment.evidence.evidence_quality,
-                "success_count": assessment.evidence.success_count,
-                "total_attempts": assessment.evidence.total_attempts,
-                "caveats": assessment.evidence.caveats,
+                "success_rate": ev.smoothed_success_rate,
+                "confidence_interval": list(ev.confidence_interval),
+                "techniques_tested": len(tested),
+                "technique_ids": tested,
+                "evidence_quality": ev.evidence_quality,
+                "success_count": ev.success_count,
+                "total_attempts": ev.total_attempts,
+                "caveats": ev.caveats,
                 "recommendations": assessment.recommendations,
                 "is_insufficient_evidence": assessment.is_insufficient_evidence,
             })
@@ -207,13 +328,10 @@ class HtmlReportRenderer:
     def _build_heatmap(self, campaign: Campaign) -> dict:
         """Build surface x goal heatmap matrix."""
         # Group evaluations by (surface, goal)
-        tech_map = {}
-        for t in self.registry.get_all():
-            tech_map[t.id] = t
+        tech_map = self.registry.get_all_by_id()
 
-        # Count successes per (surface, goal)
-        matrix: dict[str, dict[str, dict]] = defaultdict(lambda: defaultdict(lambda: {"count": 0, "successes": 0, "rate": 0}))
-        surfaces_seen = set()
+        # Count [attempts, successes] per (surface, goal)
+        cells: dict[tuple[str, str], list[int]] = {}
         goals_seen = set()
 
         for evaluation in campaign.state.evaluations:
@@ -223,31 +341,35 @@ class HtmlReportRenderer:
                 continue
 
             surface = technique.surface.value
-            surfaces_seen.add(surface)
+            succeeded = int(evaluation.success is True)
 
             for goal in technique.goals_supported:
                 goal_val = goal.value
                 goals_seen.add(goal_val)
-                cell = matrix[surface][goal_val]
-                cell["count"] += 1
-                if evaluation.success is True:
-                    cell["successes"] += 1
-
-        # Calculate rates
-        for surface in matrix:
-            for goal in matrix[surface]:
-                cell = matrix[surface][goal]
-                if cell["count"] > 0:
-                    cell["rate"] = cell["successes"] / cell["count"]
+                key = (surface, goal_val)
+                cell = cells.get(key)
+                if cell is None:
+                    cells[key] = [1, succeeded]
+                else:
+                    cell[0] += 1
+                    cell[1] += succeeded
 
         # Include all surfaces for completeness
         all_surfaces = [s.value for s in Surface]
         all_goals = sorted(goals_seen) if goals_seen else []
 
+        matrix: dict[str, dict[str, dict]] = {s: {} for s in all_surfaces}
+        for (surface, goal_val), (count, successes) in cells.items():
+            matrix[surface][goal_val] = {
+                "count": count,
+                "successes": successes,
+                "rate": successes / count,
+            }
+
         return {
             "surfaces": all_surfaces,
             "goals": all_goals,
-            "matrix": {s: dict(matrix[s]) for s in all_surfaces},
+            "matrix": matrix,
         }
 
     def _build_atlas_mapping(self, techniques: list[dict]) -> dict:
@@ -255,20 +377,23 @@ class HtmlReportRenderer:
         atlas_map: dict[str, dict] = {}
 
         for t in techniques:
-            for detail in t.get("atlas_details", []):
+            tech_entry = {
+                "id": t["id"],
+                "name": t["name"],
+                "success": t["success"],
+                "score": t["score"],
+            }
+            for detail in t["atlas_details"]:
                 atlas_id = detail["id"]
-                if atlas_id not in atlas_map:
+                entry = atlas_map.get(atlas_id)
+                if entry is None:
                     atlas_map[atlas_id] = {
-                        "name": detail.get("name", ""),
-                        "tactic": detail.get("tactic", ""),
-                        "techniques": [],
+                        "name": detail["name"],
+                        "tactic": detail["tactic"],
+                        "techniques": [tech_entry],
                     }
-                atlas_map[atlas_id]["techniques"].append({
-                    "id": t["id"],
-                    "name": t["name"],
-                    "success": t["success"],
-                    "score": t["score"],
-                })
+                else:
+                    entry["techniques"].append(tech_entry)
 
         return atlas_map
 
@@ -276,49 +401,49 @@ class HtmlReportRenderer:
         self, report: DefenderReport, campaign: Campaign, techniques: list[dict]
     ) -> dict:
         """Build comprehensive statistics."""
-        total_attempts = len(campaign.state.evaluations)
-        success_count = sum(1 for e in campaign.state.evaluations if e.success is True)
-        failure_count = sum(1 for e in campaign.state.evaluations if e.success is False)
-        inconclusive_count = sum(1 for e in campaign.state.evaluations if e.success is None)
-
-        tested_techniques = [t for t in techniques if t["success"] is not None]
-        layers_tested = len([l for l in report.layer_assessments if len(l.techniques_tested) > 0])
-        max_risk = max((l.risk_score for l in report.layer_assessments), default=0)
-
-        # Per-domain stats
+        evaluations = campaign.state.evaluations
+        assessments = report.layer_assessments
+        total_attempts = len(evaluations)
+        success_count = failure_count = inconclusive_count = 0
+        for e in evaluations:
+            if e.success is True:
+                success_count += 1
+            elif e.success is False:
+                failure_count += 1
+            else:
+                inconclusive_count += 1
+
+        layers_tested = len([l for l in assessments if len(l.techniques_tested) > 0])
+        max_risk = max((l.risk_score for l in assessments), default=0)
+
+        # Per-domain / per-surface / per-phase stats in a single pass
         per_domain: dict[str, dict] = defaultdict(lambda: {"total": 0, "successes": 0, "techniques": 0})
-        for t in techniques:
-            d = per_domain[t["domain"]]
-            d["techniques"] += 1
-            if t["success"] is not None:
-                d["total"] += 1
-                if t["success"]:
-                    d["successes"] += 1
-        for d in per_domain.values():
-            d["success_rate"] = f"{d['successes']}/{d['total']} ({d['successes']/max(d['total'],1)*100:.0f}%)"
-
-        # Per-surface stats
         per_surface: dict[str, dict] = defaultdict(lambda: {"total": 0, "successes": 0, "techniques": 0})
+        per_phase: dict[str, dict] = {}
+        tested_count = 0
         for t in techniques:
+            succ = t["success"]
+            d = per_domain[t["domain"]]
             s = per_surface[t["surface"]]
+            phase = t.get("phase", "unknown")
+            p = per_phase.get(phase)
+            if p is None:
+                p = per_phase[phase] = {"total": 0, "success": 0, "rate": 0}
+            d["techniques"] += 1
             s["techniques"] += 1
-            if t["success"] is not None:
+            if succ is not None:
+                tested_count += 1
+                d["total"] += 1
                 s["total"] += 1
-                if t["success"]:
+                p["total"] += 1
+                if succ:
+                    d["successes"] += 1
                     s["successes"] += 1
-        for s in per_surface.values():
-            s["success_rate"] = f"{s['successes']}/{s['total']} ({s['successes']/max(s['total'],1)*100:.0f}%)"
+                    p["success"] += 1
 
-        # Per-phase stats
-        per_phase: dict[str, dict] = {}
-        for t in techniques:
-            phase = t.get("phase", "unknown")
-            if phase not in per_phase:
-                per_phase[phase] = {"total": 0, "success": 0, "rate": 0}
-            if t["success"] is not None:
-                per_phase[phase]["total"] += 1
-                if t["success"]:
-                    per_phase[phase]["success"] += 1
+        for group in (per_domain, per_surface):
+            for g in group.values():
+                g["success_rate"] = f"{g['successes']}/{g['total']} ({g['successes']/max(g['total'],1)*100:.0f}%)"
         for p in per_phase.values():
             p["rate"] = p["success"] / max(p["total"], 1)
 
@@ -326,8 +451,8 @@ class HtmlReportRenderer:
         all_catalog = self.registry.get_all()
         coverage = {
             "catalog_size": len(all_catalog),
-            "techniques_tested": len(tested_techniques),
-            "coverage_rate": f"{len(tested_techniques)/max(len(all_catalog),1)*100:.1f}%",
+            "techniques_tested": tested_count,
+            "coverage_rate": f"{tested_count/max(len(all_catalog),1)*100:.1f}%",
             "layers_tested": f"{layers_tested}/6",
             "unique_atlas_ids": len(set(
                 ref for t in techniques for ref in t.get("atlas_refs", [])
@@ -356,7 +481,7 @@ class HtmlReportRenderer:
         }
 
         return {
-            "total_techniques_tested": len(tested_techniques),
+            "total_techniques_tested": tested_count,
             "total_attempts": total_attempts,
             "success_count": success_count,
             "failure_count": failure_count,
@@ -403,15 +528,16 @@ class HtmlReportRenderer:
         """Build compliance framework data from report summaries."""
         return report.compliance_summaries
 
-    def _find_evaluation(self, campaign: Campaign, technique_id: str):
-        """Find the best evaluation result for a technique."""
-        best = None
+    def _index_best_evaluations(self, campaign: Campaign) -> dict[str, EvaluationResult]:
+        """Index the best evaluation result per technique in a single pass."""
+        best_by_tech: dict[str, EvaluationResult] = {}
         for evaluation in campaign.state.evaluations:
-            if evaluation.comparability.technique_id == technique_id:
-                if best is None:
-                    best = evaluation
-                elif evaluation.success is True and best.success is not True:
-                    best = evaluation
-                elif (evaluation.score or 0) > (best.score or 0):
-                    best = evaluation
-        return best
+            technique_id = evaluation.comparability.technique_id
+            best = best_by_tech.get(technique_id)
+            if best is None:
+                best_by_tech[technique_id] = evaluation
+            elif evaluation.success is True and best.success is not True:
+                best_by_tech[technique_id] = evaluation
+            elif (evaluation.score or 0) > (best.score or 0):
+                best_by_tech[technique_id] = evaluation
+        return best_by_tech
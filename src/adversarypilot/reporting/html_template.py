@@ -4,14 +4,19 @@ Uses pure vanilla JS + Canvas for attack graph, SVG for heatmap.
 Zero external dependencies — works fully offline.
 """
 
-HTML_TEMPLATE = r"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>AdversaryPilot Security Assessment Report</title>
-<style>
-:root {
+import re
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+_STYLE = """:root {
     --bg-primary: #0d1117;
     --bg-secondary: #161b22;
     --bg-tertiary: #21262d;
@@ -64,6 +69,9 @@ a { color: var(--accent); text-decoration: none; }
 .tab-btn.active { background: var(--accent-dim); color: #fff; }
 .tab-panel { display: none; }
 .tab-panel.active { display: block; }
+/* Inactive tabs are display:none already; within the open tab, let the browser
+   skip layout and paint for repeated blocks that are scrolled out of view. */
+#compliance-panel .panel, .layer-card, .atlas-card, .stat-panel { content-visibility: auto; contain-intrinsic-size: auto 240px; }
 
 /* Cards / Panels */
 .panel { background: var(--bg-secondary); border: 1px solid var(--border); border-radius: 8px; margin-bottom: 24px; overflow: hidden; }
@@ -72,7 +80,7 @@ a { color: var(--accent); text-decoration: none; }
 .panel-body { padding: 20px; }
 
 /* Attack Graph Canvas */
-#graph-canvas { width: 100%; height: 650px; background: var(--bg-primary); border-radius: 6px; cursor: grab; }
+#graph-canvas { width: 100%; height: 650px; background: var(--bg-primary); border-radius: 6px; cursor: grab; touch-action: none; }
 #graph-canvas:active { cursor: grabbing; }
 .graph-controls { display: flex; gap: 8px; padding: 12px 20px; border-top: 1px solid var(--border); }
 .graph-controls button { background: var(--bg-tertiary); color: var(--text-primary); border: 1px solid var(--border); padding: 6px 14px; border-radius: 4px; cursor: pointer; font-size: 12px; }
@@ -147,6 +155,7 @@ a { color: var(--accent); text-decoration: none; }
 
 /* Raw Data */
 .raw-data-pre { background: var(--bg-primary); padding: 16px; border-radius: 6px; overflow: auto; max-height: 600px; font-family: 'SF Mono', Monaco, 'Cascadia Code', monospace; font-size: 12px; line-height: 1.6; color: var(--text-secondary); }
+.raw-data-pre[aria-busy="true"] { opacity: 0.6; }
 
 /* Responsive */
 @media (max-width: 768px) {
@@ -155,7 +164,15 @@ a { color: var(--accent); text-decoration: none; }
     .header-meta { gap: 12px; }
     .tab-bar { overflow-x: auto; }
 }
-</style>
+"""
+
+_TEMPLATE_SOURCE = r"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>AdversaryPilot Security Assessment Report</title>
+<style>{{STYLE}}</style>
 </head>
 <body>
 <div class="container">
@@ -224,6 +241,7 @@ a { color: var(--accent); text-decoration: none; }
         <div class="panel">
             <div class="panel-header"><h3>Technique Details</h3><span id="tech-count" style="font-size:12px;color:var(--text-muted)"></span></div>
             <div style="overflow-x:auto"><table class="tech-table" id="tech-table"><thead></thead><tbody></tbody></table></div>
+            <template id="tech-row-tpl"><tr><td><code style="font-size:11px;color:var(--cyan)"></code></td><td></td><td><span class="badge badge-neutral"></span></td><td><span class="badge badge-neutral"></span></td><td><span class="badge badge-neutral"></span></td><td><span class="badge"></span></td><td><span class="score-bar"><span class="score-fill"></span></span></td><td></td><td><span class="badge badge-neutral"></span></td><td></td></tr></template>
         </div>
     </div>
 
@@ -246,59 +264,155 @@ a { color: var(--accent); text-decoration: none; }
     </div>
 </div>
 
+<script type="application/json" id="ap-data">{{DATA_JSON}}</script>
 <script>
+// ============================================================================
+// DOM REFERENCES
+// ============================================================================
+// The script runs after the markup, so static nodes are resolved once here.
+const NODES = {
+    apData: document.getElementById('ap-data'),
+    reportTitle: document.getElementById('report-title'),
+    reportSubtitle: document.getElementById('report-subtitle'),
+    headerMeta: document.getElementById('header-meta'),
+    summaryGrid: document.getElementById('summary-grid'),
+    executivePanel: document.getElementById('executive-panel'),
+    graphCanvas: document.getElementById('graph-canvas'),
+    graphInfo: document.getElementById('graph-info'),
+    layerGrid: document.getElementById('layer-grid'),
+    heatmapBody: document.getElementById('heatmap-body'),
+    techCount: document.getElementById('tech-count'),
+    techThead: document.querySelector('#tech-table thead'),
+    techTbody: document.querySelector('#tech-table tbody'),
+    techRowTpl: document.getElementById('tech-row-tpl'),
+    atlasGrid: document.getElementById('atlas-grid'),
+    statsGrid: document.getElementById('stats-grid'),
+    beliefsPanel: document.getElementById('beliefs-panel'),
+    compliancePanel: document.getElementById('compliance-panel'),
+    rawData: document.getElementById('raw-data'),
+    tabButtons: document.querySelectorAll('.tab-btn'),
+    tabPanels: document.querySelectorAll('.tab-panel'),
+};
+
 // ============================================================================
 // DATA INJECTION POINT
 // ============================================================================
-const DATA = {{DATA_JSON}};
+// The payload is embedded as inert JSON and parsed on first use.
+let _DATA = null;
+function getData() {
+    return _DATA ||= JSON.parse(NODES.apData.textContent);
+}
+
+// Sorted views are computed once, on copies, so the payload keeps its order
+let _sortedTechniques = null;
+function sortedTechniques() {
+    return _sortedTechniques ||= (getData().techniques || []).slice().sort((a, b) => (b.score || 0) - (a.score || 0));
+}
+
+let _sortedAtlas = null;
+function sortedAtlasEntries() {
+    return _sortedAtlas ||= Object.entries(getData().atlas_mapping || {}).sort(([a], [b]) => a.localeCompare(b));
+}
 
 // ============================================================================
 // UTILITY FUNCTIONS
 // ============================================================================
+const ENT = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+const ESC_TEST = /[&<>"']/;
+const ESC_RE = /[&<>"']/g;
+
+// Escape for both text and quoted attribute contexts, without touching the DOM.
+// Most values (ids, enum names) contain nothing to escape and are returned as-is.
 function esc(text) {
     if (text == null) return '';
-    const d = document.createElement('div');
-    d.textContent = String(text);
-    return d.innerHTML;
+    const s = String(text);
+    return ESC_TEST.test(s) ? s.replace(ESC_RE, c => ENT[c]) : s;
+}
+
+// esc() for low-cardinality values (phases, surfaces, goals, technique names)
+// that repeat across many cells
+const escCache = new Map();
+function escMemo(text) {
+    let v = escCache.get(text);
+    if (v === undefined) {
+        v = esc(text);
+        escCache.set(text, v);
+    }
+    return v;
+}
+
+// Parse markup once, in the element's own context, and swap it in with a
+// single DOM mutation instead of an innerHTML round-trip
+function htmlFragment(el, html) {
+    const range = document.createRange();
+    range.selectNodeContents(el);
+    return range.createContextualFragment(html);
+}
+
+function setHTML(el, html) {
+    el.replaceChildren(htmlFragment(el, html));
 }
 
 function pct(v) { return (v * 100).toFixed(1) + '%'; }
 
+// pct() for the grid tabs, where the same rates recur across cells. Keyed on
+// the exact value so memoized and plain output never differ.
+const pctCache = new Map();
+function pctMemo(v) {
+    let s = pctCache.get(v);
+    if (s === undefined) {
+        s = pct(v);
+        pctCache.set(v, s);
+    }
+    return s;
+}
+
+// [min score, color, label], highest tier first
+const RISK_TIERS = [
+    [0.7, 'var(--danger)', 'Critical'],
+    [0.4, 'var(--warning)', 'Moderate'],
+];
+
+function riskTier(score) {
+    for (const tier of RISK_TIERS) {
+        if (score >= tier[0]) return tier;
+    }
+    return null;
+}
+
 function riskColor(score) {
-    if (score >= 0.7) return 'var(--danger)';
-    if (score >= 0.4) return 'var(--warning)';
-    if (score > 0) return 'var(--success)';
-    return 'var(--text-muted)';
+    const tier = riskTier(score);
+    if (tier) return tier[1];
+    return score > 0 ? 'var(--success)' : 'var(--text-muted)';
 }
 
 function riskLabel(score) {
-    if (score >= 0.7) return 'Critical';
-    if (score >= 0.4) return 'Moderate';
-    if (score > 0.1) return 'Low';
-    return 'Minimal';
+    const tier = riskTier(score);
+    if (tier) return tier[2];
+    return score > 0.1 ? 'Low' : 'Minimal';
 }
 
+// Outcome lookups keyed by the success flag (true / false / null)
+const OUTCOME_CLASS = { true: 'badge-success', false: 'badge-danger' };
+const OUTCOME_TEXT = { true: 'Success', false: 'Failure' };
+
 function outcomeClass(success) {
-    if (success === true) return 'badge-success';
-    if (success === false) return 'badge-danger';
-    return 'badge-warning';
+    return OUTCOME_CLASS[success] || 'badge-warning';
 }
 
 function outcomeText(success) {
-    if (success === true) return 'Success';
-    if (success === false) return 'Failure';
-    return 'Inconclusive';
+    return OUTCOME_TEXT[success] || 'Inconclusive';
 }
 
 // ============================================================================
 // HEADER + SUMMARY
 // ============================================================================
 function renderHeader() {
-    const r = DATA.report;
-    document.getElementById('report-title').textContent = r.title || 'AdversaryPilot Security Assessment';
-    document.getElementById('report-subtitle').textContent = r.overall_risk_summary || '';
+    const r = getData().report;
+    NODES.reportTitle.textContent = r.title || 'AdversaryPilot Security Assessment';
+    NODES.reportSubtitle.textContent = r.overall_risk_summary || '';
 
-    const meta = document.getElementById('header-meta');
+    const meta = NODES.headerMeta;
     const items = [
         ['Campaign', r.campaign_id],
         ['Target Type', r.target_type],
@@ -307,14 +421,17 @@ function renderHeader() {
         ['Primary Weakness', r.primary_weak_layer || 'None'],
     ].filter(([,v]) => v);
 
-    meta.innerHTML = items.map(([label, value]) =>
-        `<div class="meta-item"><span class="meta-label">${esc(label)}</span><span class="meta-value">${esc(value)}</span></div>`
-    ).join('');
+    const parts = [];
+    items.forEach(([label, value]) => {
+        parts.push('<div class="meta-item"><span class="meta-label">', esc(label),
+            '</span><span class="meta-value">', esc(value), '</span></div>');
+    });
+    meta.innerHTML = parts.join('');
 }
 
 function renderSummary() {
-    const s = DATA.statistics || {};
-    const grid = document.getElementById('summary-grid');
+    const s = getData().statistics || {};
+    const grid = NODES.summaryGrid;
     const cards = [
         { value: s.total_techniques_tested || 0, label: 'Techniques Tested', cls: 'value-info' },
         { value: s.total_attempts || 0, label: 'Total Attempts', cls: 'value-purple' },
@@ -323,99 +440,127 @@ function renderSummary() {
         { value: s.layers_tested || 0, label: 'Layers Assessed', cls: 'value-info' },
         { value: riskLabel(s.max_risk_score || 0), label: 'Max Risk Level', cls: (s.max_risk_score || 0) >= 0.7 ? 'value-danger' : (s.max_risk_score || 0) >= 0.4 ? 'value-warning' : 'value-success' },
     ];
-    grid.innerHTML = cards.map(c =>
-        `<div class="summary-card"><div class="value ${c.cls}">${esc(String(c.value))}</div><div class="label">${esc(c.label)}</div></div>`
-    ).join('');
+    const parts = [];
+    cards.forEach(c => {
+        parts.push('<div class="summary-card"><div class="value ', c.cls, '">', esc(String(c.value)),
+            '</div><div class="label">', esc(c.label), '</div></div>');
+    });
+    grid.innerHTML = parts.join('');
 }
 
 // ============================================================================
 // EXECUTIVE SUMMARY
 // ============================================================================
 function renderExecutive() {
-    const panel = document.getElementById('executive-panel');
-    const r = DATA.report;
-    const s = DATA.statistics || {};
-    const layers = DATA.layers || [];
-    const techs = DATA.techniques || [];
-
-    const primaryLayer = layers.find(l => l.is_primary_weakness);
-    const testedLayers = layers.filter(l => l.techniques_tested > 0);
-    const untestedLayers = layers.filter(l => l.techniques_tested === 0);
-    const successfulTechs = techs.filter(t => t.success === true);
-    const failedTechs = techs.filter(t => t.success === false);
-
-    let html = '<div class="panel"><div class="panel-header"><h3>Executive Summary</h3></div><div class="panel-body exec-summary">';
-
-    html += `<p>This assessment evaluated <strong>${s.total_techniques_tested || 0} attack techniques</strong> across
-        <strong>${testedLayers.length} attack surface layers</strong> against the target system
+    const panel = NODES.executivePanel;
+    const r = getData().report;
+    const s = getData().statistics || {};
+    const layers = getData().layers || [];
+    const techs = getData().techniques || [];
+
+    // One pass over layers and one over techniques
+    let primaryLayer = null;
+    let testedLayerCount = 0;
+    const untestedLayers = [];
+    const allRecs = [];
+    for (const l of layers) {
+        if (l.is_primary_weakness && !primaryLayer) primaryLayer = l;
+        if (l.techniques_tested > 0) testedLayerCount++;
+        else if (l.techniques_tested === 0) untestedLayers.push(l);
+        for (const rec of l.recommendations || []) allRecs.push({ layer: l.layer, rec });
+    }
+
+    // Top five successes by score, kept sorted by bounded insertion
+    let successCount = 0, failCount = 0;
+    const topSuccesses = [];
+    for (const t of techs) {
+        if (t.success === false) { failCount++; continue; }
+        if (t.success !== true) continue;
+        successCount++;
+        const score = t.score || 0;
+        let i = topSuccesses.length;
+        while (i > 0 && (topSuccesses[i - 1].score || 0) < score) i--;
+        if (i < 5) {
+            topSuccesses.splice(i, 0, t);
+            if (topSuccesses.length > 5) topSuccesses.pop();
+        }
+    }
+
+    const parts = ['<div class="panel"><div class="panel-header"><h3>Executive Summary</h3></div><div class="panel-body exec-summary">'];
+
+    parts.push(`<p>This assessment evaluated <strong>${s.total_techniques_tested || 0} attack techniques</strong> across
+        <strong>${testedLayerCount} attack surface layers</strong> against the target system
         (${esc(r.target_type || 'unknown')}). A total of <strong>${s.total_attempts || 0} attack attempts</strong>
-        were executed with an overall success rate of <strong>${pct(s.overall_success_rate || 0)}</strong>.</p>`;
+        were executed with an overall success rate of <strong>${pct(s.overall_success_rate || 0)}</strong>.</p>`);
 
     if (r.overall_risk_summary) {
-        html += `<p>${esc(r.overall_risk_summary)}</p>`;
+        parts.push('<p>', esc(r.overall_risk_summary), '</p>');
     }
 
     // Key findings
-    html += '<h4 style="margin: 20px 0 12px; font-size: 15px;">Key Findings</h4>';
+    parts.push('<h4 style="margin: 20px 0 12px; font-size: 15px;">Key Findings</h4>');
 
     if (primaryLayer) {
         const severity = primaryLayer.risk_score >= 0.7 ? 'critical' : primaryLayer.risk_score >= 0.4 ? 'moderate' : 'low';
-        html += `<div class="finding ${severity}">
+        parts.push(`<div class="finding ${severity}">
             <h4>Primary Weakness: ${esc(primaryLayer.layer.toUpperCase())} Layer</h4>
             <p>Risk score ${pct(primaryLayer.risk_score)} with ${pct(primaryLayer.success_rate)} attack success rate
             across ${primaryLayer.techniques_tested} techniques tested.
             Confidence interval: [${primaryLayer.confidence_interval[0].toFixed(2)}, ${primaryLayer.confidence_interval[1].toFixed(2)}].</p>
-        </div>`;
+        </div>`);
     }
 
-    if (successfulTechs.length > 0) {
-        const topSuccesses = successfulTechs.sort((a, b) => (b.score || 0) - (a.score || 0)).slice(0, 5);
-        html += `<div class="finding critical">
-            <h4>${successfulTechs.length} Techniques Succeeded</h4>
-            <p>Highest impact: ${topSuccesses.map(t => esc(t.name) + ' (' + pct(t.score || 0) + ')').join(', ')}.</p>
-        </div>`;
+    if (successCount > 0) {
+        parts.push(`<div class="finding critical">
+            <h4>${successCount} Techniques Succeeded</h4>
+            <p>Highest impact: `);
+        topSuccesses.forEach((t, i) => {
+            if (i > 0) parts.push(', ');
+            parts.push(esc(t.name), ' (', pct(t.score || 0), ')');
+        });
+        parts.push(`.</p>
+        </div>`);
     }
 
     if (untestedLayers.length > 0) {
-        html += `<div class="finding moderate">
+        parts.push(`<div class="finding moderate">
             <h4>${untestedLayers.length} Layer(s) Not Yet Tested</h4>
             <p>The following layers have no test coverage: ${untestedLayers.map(l => esc(l.layer)).join(', ')}.
             Additional testing is recommended.</p>
-        </div>`;
+        </div>`);
     }
 
-    if (failedTechs.length > 0) {
-        html += `<div class="finding low">
-            <h4>${failedTechs.length} Techniques Defended Successfully</h4>
-            <p>The target successfully defended against ${failedTechs.length} attack techniques,
+    if (failCount > 0) {
+        parts.push(`<div class="finding low">
+            <h4>${failCount} Techniques Defended Successfully</h4>
+            <p>The target successfully defended against ${failCount} attack techniques,
             indicating effective security controls in those areas.</p>
-        </div>`;
+        </div>`);
     }
 
     // Recommendations
-    const allRecs = layers.flatMap(l => (l.recommendations || []).map(r => ({ layer: l.layer, rec: r })));
     if (allRecs.length > 0) {
-        html += '<h4 style="margin: 20px 0 12px; font-size: 15px;">Recommendations</h4>';
+        parts.push('<h4 style="margin: 20px 0 12px; font-size: 15px;">Recommendations</h4>');
         allRecs.forEach(({ layer, rec }) => {
             const isHigh = rec.includes('HIGH');
             const isMod = rec.includes('MODERATE');
-            html += `<div class="finding ${isHigh ? 'critical' : isMod ? 'moderate' : 'low'}">
-                <h4>${esc(layer.toUpperCase())} Layer</h4>
-                <p>${esc(rec)}</p>
-            </div>`;
+            parts.push('<div class="finding ', isHigh ? 'critical' : isMod ? 'moderate' : 'low', `">
+                <h4>`, esc(layer.toUpperCase()), ` Layer</h4>
+                <p>`, esc(rec), `</p>
+            </div>`);
         });
     }
 
     // Comparability warnings
-    if (DATA.report.comparability_warnings && DATA.report.comparability_warnings.length > 0) {
-        html += '<h4 style="margin: 20px 0 12px; font-size: 15px;">Comparability Warnings</h4>';
-        DATA.report.comparability_warnings.forEach(w => {
-            html += `<div class="finding moderate"><p>${esc(w)}</p></div>`;
+    if (r.comparability_warnings && r.comparability_warnings.length > 0) {
+        parts.push('<h4 style="margin: 20px 0 12px; font-size: 15px;">Comparability Warnings</h4>');
+        r.comparability_warnings.forEach(w => {
+            parts.push('<div class="finding moderate"><p>', esc(w), '</p></div>');
         });
     }
 
-    html += '</div></div>';
-    panel.innerHTML = html;
+    parts.push('</div></div>');
+    panel.innerHTML = parts.join('');
 }
 
 // ============================================================================
@@ -425,6 +570,7 @@ let graphNodes = [];
 let graphEdges = [];
 let showLabels = true;
 let physicsRunning = true;
+let graphVisible = false;
 let dragNode = null;
 let panX = 0, panY = 0, scale = 1;
 let lastMouse = null;
@@ -438,231 +584,496 @@ const SURFACE_COLORS = {
     action: '#d29922'
 };
 
+// Node fill by outcome; nodes without a success flag fall back to gray
+const NODE_FILL = { true: '#3fb950', false: '#f85149', null: '#d29922' };
+
+// Force simulation over typed arrays. Kept free of outer references so its
+// source can be shipped to a worker as-is.
+function createSimulation(init) {
+    const { xs, ys, edgeSrc, edgeTgt, clusterY, W, H } = init;
+    const N = xs.length, E = edgeSrc.length;
+    const vxs = new Float32Array(N), vys = new Float32Array(N);
+
+    // Barnes-Hut quadtree: cells far enough away (size/dist < theta) that do
+    // not contain the node itself act as a single body at their center of mass.
+    const theta = 0.9;
+    const theta2 = theta * theta;
+
+    function buildQuadtree() {
+        let x0 = 0, y0 = 0, x1 = W, y1 = H;
+        const members = new Array(N);
+        for (let i = 0; i < N; i++) {
+            const x = xs[i], y = ys[i];
+            if (x < x0) x0 = x; if (x > x1) x1 = x;
+            if (y < y0) y0 = y; if (y > y1) y1 = y;
+            members[i] = i;
+        }
+        return buildCell(members, x0, y0, Math.max(x1 - x0, y1 - y0) || 1);
+    }
+
+    function buildCell(members, x0, y0, size) {
+        let cx = 0, cy = 0;
+        for (const i of members) { cx += xs[i]; cy += ys[i]; }
+        const cell = { x0, y0, cx: cx / members.length, cy: cy / members.length, mass: members.length, size, children: null, node: null };
+        if (members.length === 1 || size < 1e-3) {
+            cell.node = members;
+            return cell;
+        }
+        const half = size / 2, mx = x0 + half, my = y0 + half;
+        const quads = [[], [], [], []];
+        for (const i of members) quads[(xs[i] >= mx ? 1 : 0) + (ys[i] >= my ? 2 : 0)].push(i);
+        cell.children = [];
+        quads.forEach((q, k) => {
+            if (q.length) cell.children.push(buildCell(q, k & 1 ? mx : x0, k & 2 ? my : y0, half));
+        });
+        return cell;
+    }
+
+    function applyRepulsion(i, cell) {
+        const x = xs[i], y = ys[i];
+        if (cell.node) {
+            for (const j of cell.node) {
+                if (j === i) continue;
+                const dx = xs[j] - x;
+                const dy = ys[j] - y;
+                const d2 = dx * dx + dy * dy || 1;
+                // |F| = 3000 / d^2 along the unit vector (dx, dy) / d
+                const f = 3000 / (d2 * Math.sqrt(d2));
+                vxs[i] -= dx * f; vys[i] -= dy * f;
+            }
+            return;
+        }
+        const dx = cell.cx - x;
+        const dy = cell.cy - y;
+        const d2 = dx * dx + dy * dy || 1;
+        const inside = x >= cell.x0 && x <= cell.x0 + cell.size && y >= cell.y0 && y <= cell.y0 + cell.size;
+        if (!inside && cell.size * cell.size < theta2 * d2) {
+            const f = 3000 * cell.mass / (d2 * Math.sqrt(d2));
+            vxs[i] -= dx * f; vys[i] -= dy * f;
+            return;
+        }
+        for (const c of cell.children) applyRepulsion(i, c);
+    }
+
+    // Advance one tick, write interleaved x/y into `out` and return the total
+    // movement. A dragged node (dragIdx >= 0) is pinned to (dragX, dragY).
+    function step(dragIdx, dragX, dragY, out) {
+        const alpha = 0.3;
+        let kineticEnergy = 0;
+
+        if (dragIdx >= 0) {
+            xs[dragIdx] = dragX; ys[dragIdx] = dragY;
+            vxs[dragIdx] = 0; vys[dragIdx] = 0;
+        }
+
+        // Center gravity
+        for (let i = 0; i < N; i++) {
+            vxs[i] += (W/2 - xs[i]) * 0.001;
+            vys[i] += (H/2 - ys[i]) * 0.001;
+        }
+
+        // Repulsion (Barnes-Hut)
+        const tree = buildQuadtree();
+        for (let i = 0; i < N; i++) applyRepulsion(i, tree);
+
+        // Attraction along edges
+        for (let k = 0; k < E; k++) {
+            const s = edgeSrc[k], t = edgeTgt[k];
+            const dx = xs[t] - xs[s];
+            const dy = ys[t] - ys[s];
+            const dist = Math.sqrt(dx * dx + dy * dy) || 1;
+            const scaled = (dist - 120) * 0.01 / dist;
+            const fx = dx * scaled;
+            const fy = dy * scaled;
+            vxs[s] += fx; vys[s] += fy;
+            vxs[t] -= fx; vys[t] -= fy;
+        }
+
+        // Layer clustering: group by surface vertically
+        for (let i = 0; i < N; i++) {
+            if (clusterY[i] === clusterY[i]) vys[i] += (clusterY[i] - ys[i]) * 0.005;
+        }
+
+        // Apply velocity with damping
+        for (let i = 0; i < N; i++) {
+            if (i !== dragIdx) {
+                const px = xs[i], py = ys[i];
+                vxs[i] *= 0.85; vys[i] *= 0.85;
+                xs[i] = Math.max(30, Math.min(W - 30, px + vxs[i] * alpha));
+                ys[i] = Math.max(30, Math.min(H - 30, py + vys[i] * alpha));
+                // Measure actual movement so nodes pinned at the border count as settled
+                kineticEnergy += Math.abs(xs[i] - px) + Math.abs(ys[i] - py);
+            }
+            out[2 * i] = xs[i];
+            out[2 * i + 1] = ys[i];
+        }
+        return kineticEnergy;
+    }
+
+    // Move node i to (x, y) at rest, e.g. where the user dropped it
+    function setPosition(i, x, y) {
+        xs[i] = x; ys[i] = y;
+        vxs[i] = 0; vys[i] = 0;
+    }
+
+    return { step, setPosition };
+}
+
 function initGraph() {
-    const canvas = document.getElementById('graph-canvas');
+    const canvas = NODES.graphCanvas;
     if (!canvas) return;
     const ctx = canvas.getContext('2d');
     const rect = canvas.parentElement.getBoundingClientRect();
-    canvas.width = rect.width;
-    canvas.height = 650;
-    const W = canvas.width, H = canvas.height;
-
-    // Build nodes from DATA
-    const nodes = (DATA.graph?.nodes || []).map((n, i) => ({
+    // Layout and hit testing work in CSS pixels (W x H); the backing store is
+    // scaled by the device pixel ratio so HiDPI screens get native resolution.
+    const dpr = Math.min(window.devicePixelRatio || 1, 2);
+    const W = rect.width, H = 650;
+    canvas.width = Math.round(W * dpr);
+    canvas.height = Math.round(H * dpr);
+
+    // Build nodes from the report data
+    const nodes = (getData().graph?.nodes || []).map((n, i) => ({
         ...n,
+        idx: i,
         x: W/2 + (Math.random() - 0.5) * W * 0.6,
         y: H/2 + (Math.random() - 0.5) * H * 0.6,
         vx: 0, vy: 0,
         radius: 18 + (n.score || 0.3) * 12,
+        // Precomputed draw styles so draw() does no per-frame branching
+        fillStyle: NODE_FILL[n.success] || '#6e7681',
+        ringStyle: SURFACE_COLORS[n.surface || n.layer] || '#555',
+        labelShort: n.label.length > 22 ? n.label.substring(0, 20) + '...' : n.label,
+        scoreText: n.score != null ? (n.score * 100).toFixed(0) : '',
     }));
 
-    const nodeMap = {};
-    nodes.forEach(n => nodeMap[n.id] = n);
-
-    const edges = (DATA.graph?.edges || []).filter(e =>
-        nodeMap[e.source] && nodeMap[e.target]
-    ).map(e => ({
-        ...e,
-        sourceNode: nodeMap[e.source],
-        targetNode: nodeMap[e.target],
-    }));
+    const nodeMap = new Map();
+    nodes.forEach(n => nodeMap.set(n.id, n));
+
+    // Resolve endpoints and drop duplicate (undirected) edges in one pass,
+    // keyed by the packed pair of node indices
+    const N = nodes.length;
+    const seen = new Set();
+    const uniqueEdges = [];
+    let edgeCount = 0;
+    for (const e of getData().graph?.edges || []) {
+        const s = nodeMap.get(e.source), t = nodeMap.get(e.target);
+        if (!s || !t) continue;
+        edgeCount++;
+        const key = Math.min(s.idx, t.idx) * N + Math.max(s.idx, t.idx);
+        if (seen.has(key)) continue;
+        seen.add(key);
+        uniqueEdges.push({ ...e, sourceNode: s, targetNode: t });
+    }
 
     graphNodes = nodes;
-    graphEdges = edges;
+    graphEdges = uniqueEdges;
+
+    NODES.graphInfo.textContent = `${nodes.length} nodes, ${edgeCount} edges`;
+
+    // Physics runs in createSimulation() over typed arrays indexed like
+    // `nodes`; the node objects only carry positions back out for drawing
+    // and hit testing.
+    const xs = new Float32Array(N), ys = new Float32Array(N);
+    nodes.forEach((n, i) => { xs[i] = n.x; ys[i] = n.y; });
+
+    const E = uniqueEdges.length;
+    const edgeSrc = new Int32Array(E), edgeTgt = new Int32Array(E);
+    uniqueEdges.forEach((e, k) => { edgeSrc[k] = e.sourceNode.idx; edgeTgt[k] = e.targetNode.idx; });
+
+    // Layer clustering target per node (NaN when the surface is unknown)
+    const surfaceOrder = ['guardrail', 'model', 'data', 'retrieval', 'tool', 'action'];
+    const clusterY = new Float32Array(N);
+    nodes.forEach((n, i) => {
+        const idx = surfaceOrder.indexOf(n.surface || n.layer);
+        clusterY[i] = idx >= 0 ? (idx + 1) / (surfaceOrder.length + 1) * H : NaN;
+    });
 
-    document.getElementById('graph-info').textContent = `${nodes.length} nodes, ${edges.length} edges`;
+    const simInit = { xs, ys, edgeSrc, edgeTgt, clusterY, W, H };
 
-    // Deduplicate edges for cleaner layout
-    const edgeSet = new Set();
-    const uniqueEdges = edges.filter(e => {
-        const key = [e.source, e.target].sort().join(':');
-        if (edgeSet.has(key)) return false;
-        edgeSet.add(key);
-        return true;
-    });
+    // Redraw only while something changes: the layout is still moving, the
+    // user is interacting, or a control marked the scene dirty.
+    let dirty = true;
+    let calmFrames = 0;
+    let frameScheduled = false;
 
-    // Force simulation
-    function tick() {
-        if (!physicsRunning) { draw(); requestAnimationFrame(tick); return; }
-        const alpha = 0.3;
+    function schedule() {
+        if (frameScheduled) return;
+        frameScheduled = true;
+        requestAnimationFrame(tick);
+    }
 
-        // Center gravity
-        nodes.forEach(n => {
-            n.vx += (W/2 - n.x) * 0.001;
-            n.vy += (H/2 - n.y) * 0.001;
-        });
+    // The simulation runs in a worker when possible. The positions buffer
+    // ping-pongs between threads as a transferable, so only one step is in
+    // flight and nothing is copied. Without workers it runs inline.
+    let worker = null;
+    let sim = null;
+    let positions = new Float32Array(N * 2);
+    let stepPending = false;
+    // A node pinned while a step was in flight; that step's result for it is stale
+    let heldNode = null;
+    try {
+        const src = `const createSimulation = ${createSimulation};
+let sim = null;
+self.onmessage = e => {
+    const m = e.data;
+    if (m.init) { sim = createSimulation(m.init); return; }
+    if (m.pin) { sim.setPosition(m.pin.idx, m.pin.x, m.pin.y); return; }
+    const energy = sim.step(m.dragIdx, m.dragX, m.dragY, m.buf);
+    self.postMessage({ buf: m.buf, energy }, [m.buf.buffer]);
+};`;
+        const url = URL.createObjectURL(new Blob([src], { type: 'text/javascript' }));
+        try {
+            worker = new Worker(url);
+        } finally {
+            URL.revokeObjectURL(url);
+        }
+        worker.onmessage = e => {
+            stepPending = false;
+            positions = e.data.buf;
+            applyStep(e.data.energy);
+        };
+        worker.onerror = () => {
+            // e.g. blob: workers blocked by a content security policy
+            worker = null;
+            stepPending = false;
+            positions = new Float32Array(N * 2);
+            sim = createSimulation(simInit);
+            schedule();
+        };
+        worker.postMessage({ init: simInit });
+    } catch (err) {
+        worker = null;
+        sim = createSimulation(simInit);
+    }
 
-        // Repulsion (Barnes-Hut simplified)
-        for (let i = 0; i < nodes.length; i++) {
-            for (let j = i + 1; j < nodes.length; j++) {
-                let dx = nodes[j].x - nodes[i].x;
-                let dy = nodes[j].y - nodes[i].y;
-                let dist = Math.sqrt(dx * dx + dy * dy) || 1;
-                let force = 3000 / (dist * dist);
-                let fx = dx / dist * force;
-                let fy = dy / dist * force;
-                nodes[i].vx -= fx; nodes[i].vy -= fy;
-                nodes[j].vx += fx; nodes[j].vy += fy;
-            }
+    function runStep() {
+        const dragIdx = dragNode ? dragNode.idx : -1;
+        const dragX = dragNode ? dragNode.x : 0, dragY = dragNode ? dragNode.y : 0;
+        if (worker) {
+            stepPending = true;
+            worker.postMessage({ dragIdx, dragX, dragY, buf: positions }, [positions.buffer]);
+        } else {
+            applyStep(sim.step(dragIdx, dragX, dragY, positions));
         }
+    }
 
-        // Attraction along edges
-        uniqueEdges.forEach(e => {
-            let dx = e.targetNode.x - e.sourceNode.x;
-            let dy = e.targetNode.y - e.sourceNode.y;
-            let dist = Math.sqrt(dx * dx + dy * dy) || 1;
-            let force = (dist - 120) * 0.01;
-            let fx = dx / dist * force;
-            let fy = dy / dist * force;
-            e.sourceNode.vx += fx; e.sourceNode.vy += fy;
-            e.targetNode.vx -= fx; e.targetNode.vy -= fy;
-        });
+    // Copy a node's on-screen position into the simulation state
+    function pinNode(n) {
+        if (worker) {
+            worker.postMessage({ pin: { idx: n.idx, x: n.x, y: n.y } });
+            if (stepPending) heldNode = n;
+        } else {
+            sim.setPosition(n.idx, n.x, n.y);
+        }
+    }
 
-        // Layer clustering: group by surface vertically
-        const surfaceOrder = ['guardrail', 'model', 'data', 'retrieval', 'tool', 'action'];
-        nodes.forEach(n => {
-            const idx = surfaceOrder.indexOf(n.surface || n.layer);
-            if (idx >= 0) {
-                const targetY = (idx + 1) / (surfaceOrder.length + 1) * H;
-                n.vy += (targetY - n.y) * 0.005;
-            }
-        });
+    function applyStep(kineticEnergy) {
+        for (let i = 0; i < N; i++) {
+            if (nodes[i] === dragNode || nodes[i] === heldNode) continue;
+            nodes[i].x = positions[2 * i];
+            nodes[i].y = positions[2 * i + 1];
+        }
+        heldNode = null;
+        // Settled once nodes move under 0.1px a frame on average; Barnes-Hut
+        // leaves a small jitter that never decays to zero
+        calmFrames = kineticEnergy < 0.1 * N ? calmFrames + 1 : 0;
+        dirty = true;
+    }
 
-        // Apply velocity with damping
-        nodes.forEach(n => {
-            if (n === dragNode) return;
-            n.vx *= 0.85; n.vy *= 0.85;
-            n.x += n.vx * alpha;
-            n.y += n.vy * alpha;
-            n.x = Math.max(30, Math.min(W - 30, n.x));
-            n.y = Math.max(30, Math.min(H - 30, n.y));
-        });
+    function tick() {
+        frameScheduled = false;
+        // Nothing is drawn while the graph tab or the page is hidden;
+        // showing either again resumes the loop where it stopped.
+        if (!graphVisible || document.hidden) return;
+        // Step only while the layout is still moving; wake() restarts it
+        if (physicsRunning && !stepPending && (dragNode || calmFrames < 30)) runStep();
+        if (dirty) { dirty = false; draw(); }
+        if (dragNode || lastMouse || stepPending || (physicsRunning && calmFrames < 30)) schedule();
+    }
 
-        draw();
-        requestAnimationFrame(tick);
+    // Text shaping is expensive, so each node's label and score are drawn
+    // once into a small bitmap and blitted every frame. The bitmap holds the
+    // node center at (LABEL_W / 2, LABEL_TOP).
+    const LABEL_W = 160, LABEL_TOP = 8;
+    const labelCache = new Map();
+    let labelCacheShowsLabels = showLabels;
+
+    function getLabelBitmap(n) {
+        if (labelCacheShowsLabels !== showLabels) {
+            labelCache.clear();
+            labelCacheShowsLabels = showLabels;
+        }
+        if (labelCache.has(n.id)) return labelCache.get(n.id);
+        let c = null;
+        if (showLabels || n.scoreText) {
+            const h = LABEL_TOP + n.radius + 5 + 14;
+            const bw = Math.ceil(LABEL_W * dpr), bh = Math.ceil(h * dpr);
+            c = typeof OffscreenCanvas !== 'undefined'
+                ? new OffscreenCanvas(bw, bh)
+                : Object.assign(document.createElement('canvas'), { width: bw, height: bh });
+            const g = c.getContext('2d');
+            g.scale(dpr, dpr);
+            g.textAlign = 'center';
+            if (showLabels) {
+                g.font = '10px -apple-system, sans-serif';
+                g.fillStyle = '#e6edf3';
+                g.textBaseline = 'top';
+                g.fillText(n.labelShort, LABEL_W / 2, LABEL_TOP + n.radius + 5);
+            }
+            if (n.scoreText) {
+                g.font = 'bold 10px monospace';
+                g.fillStyle = '#fff';
+                g.textBaseline = 'middle';
+                g.fillText(n.scoreText, LABEL_W / 2, LABEL_TOP);
+            }
+        }
+        labelCache.set(n.id, c);
+        return c;
+    }
+
+    // Arrowhead triangle for an edge, recomputed only when an endpoint moved
+    function arrowHead(e) {
+        const s = e.sourceNode, t = e.targetNode;
+        if (e.arrow && e.arrowFrom[0] === s.x && e.arrowFrom[1] === s.y && e.arrowFrom[2] === t.x && e.arrowFrom[3] === t.y) {
+            return e.arrow;
+        }
+        const angle = Math.atan2(t.y - s.y, t.x - s.x);
+        const r = t.radius + 4;
+        const ax = t.x - Math.cos(angle) * r;
+        const ay = t.y - Math.sin(angle) * r;
+        e.arrowFrom = [s.x, s.y, t.x, t.y];
+        e.arrow = [
+            ax, ay,
+            ax - 8 * Math.cos(angle - 0.4), ay - 8 * Math.sin(angle - 0.4),
+            ax - 8 * Math.cos(angle + 0.4), ay - 8 * Math.sin(angle + 0.4),
+        ];
+        return e.arrow;
     }
 
     function draw() {
-        ctx.save();
+        ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
         ctx.clearRect(0, 0, W, H);
-        ctx.translate(panX, panY);
-        ctx.scale(scale, scale);
+        ctx.setTransform(scale * dpr, 0, 0, scale * dpr, panX * dpr, panY * dpr);
 
-        // Draw edges
+        // Draw edges: every edge shares one style, so all lines go into a
+        // single path and all arrowheads into another
         ctx.globalAlpha = 0.3;
-        uniqueEdges.forEach(e => {
-            ctx.beginPath();
+        ctx.strokeStyle = '#bc8cff';
+        ctx.fillStyle = '#bc8cff';
+        ctx.lineWidth = 1;
+        ctx.beginPath();
+        for (const e of uniqueEdges) {
             ctx.moveTo(e.sourceNode.x, e.sourceNode.y);
             ctx.lineTo(e.targetNode.x, e.targetNode.y);
-            ctx.strokeStyle = '#bc8cff';
-            ctx.lineWidth = 1;
-            ctx.stroke();
+        }
+        ctx.stroke();
 
-            // Arrow
-            const angle = Math.atan2(e.targetNode.y - e.sourceNode.y, e.targetNode.x - e.sourceNode.x);
-            const r = e.targetNode.radius + 4;
-            const ax = e.targetNode.x - Math.cos(angle) * r;
-            const ay = e.targetNode.y - Math.sin(angle) * r;
-            ctx.beginPath();
-            ctx.moveTo(ax, ay);
-            ctx.lineTo(ax - 8 * Math.cos(angle - 0.4), ay - 8 * Math.sin(angle - 0.4));
-            ctx.lineTo(ax - 8 * Math.cos(angle + 0.4), ay - 8 * Math.sin(angle + 0.4));
-            ctx.fillStyle = '#bc8cff';
-            ctx.fill();
-        });
+        ctx.beginPath();
+        for (const e of uniqueEdges) {
+            const a = arrowHead(e);
+            ctx.moveTo(a[0], a[1]);
+            ctx.lineTo(a[2], a[3]);
+            ctx.lineTo(a[4], a[5]);
+        }
+        ctx.fill();
         ctx.globalAlpha = 1;
 
         // Draw nodes
+        ctx.lineWidth = 2.5;
         nodes.forEach(n => {
             // Node circle
             ctx.beginPath();
             ctx.arc(n.x, n.y, n.radius, 0, Math.PI * 2);
 
             // Color by outcome
-            if (n.success === true) ctx.fillStyle = '#3fb950';
-            else if (n.success === false) ctx.fillStyle = '#f85149';
-            else if (n.success === null) ctx.fillStyle = '#d29922';
-            else ctx.fillStyle = '#6e7681';
-
+            ctx.fillStyle = n.fillStyle;
             ctx.fill();
 
             // Surface ring
             ctx.beginPath();
             ctx.arc(n.x, n.y, n.radius + 2, 0, Math.PI * 2);
-            ctx.strokeStyle = SURFACE_COLORS[n.surface || n.layer] || '#555';
-            ctx.lineWidth = 2.5;
+            ctx.strokeStyle = n.ringStyle;
             ctx.stroke();
 
-            // Label
-            if (showLabels) {
-                ctx.font = '10px -apple-system, sans-serif';
-                ctx.fillStyle = '#e6edf3';
-                ctx.textAlign = 'center';
-                ctx.textBaseline = 'top';
-                const label = n.label.length > 22 ? n.label.substring(0, 20) + '...' : n.label;
-                ctx.fillText(label, n.x, n.y + n.radius + 5);
-            }
-
-            // Score inside node
-            if (n.score != null) {
-                ctx.font = 'bold 10px monospace';
-                ctx.fillStyle = '#fff';
-                ctx.textAlign = 'center';
-                ctx.textBaseline = 'middle';
-                ctx.fillText((n.score * 100).toFixed(0), n.x, n.y);
-            }
+            // Label and score, rasterized once per node
+            const bitmap = getLabelBitmap(n);
+            if (bitmap) ctx.drawImage(bitmap, n.x - LABEL_W / 2, n.y - LABEL_TOP, bitmap.width / dpr, bitmap.height / dpr);
         });
-
-        ctx.restore();
     }
 
-    // Interaction
-    canvas.addEventListener('mousedown', e => {
-        const rect = canvas.getBoundingClientRect();
-        const mx = (e.clientX - rect.left - panX) / scale;
-        const my = (e.clientY - rect.top - panY) / scale;
-        dragNode = nodes.find(n => Math.hypot(n.x - mx, n.y - my) < n.radius + 4);
-        lastMouse = { x: e.clientX, y: e.clientY };
+    // Interaction: pointer events with offsetX/offsetY are already relative
+    // to the canvas, so no layout query is needed per event.
+    canvas.addEventListener('pointerdown', e => {
+        const mx = (e.offsetX - panX) / scale;
+        const my = (e.offsetY - panY) / scale;
+        dragNode = nodes.find(n => {
+            const dx = n.x - mx, dy = n.y - my, rr = n.radius + 4;
+            return dx * dx + dy * dy < rr * rr;
+        });
+        lastMouse = { x: e.offsetX, y: e.offsetY };
+        canvas.setPointerCapture(e.pointerId);
+        wake();
     });
 
-    canvas.addEventListener('mousemove', e => {
-        const rect = canvas.getBoundingClientRect();
+    canvas.addEventListener('pointermove', e => {
         if (dragNode) {
-            dragNode.x = (e.clientX - rect.left - panX) / scale;
-            dragNode.y = (e.clientY - rect.top - panY) / scale;
+            dragNode.x = (e.offsetX - panX) / scale;
+            dragNode.y = (e.offsetY - panY) / scale;
             dragNode.vx = 0; dragNode.vy = 0;
+            // No step will carry the position while paused
+            if (!physicsRunning) pinNode(dragNode);
         } else if (lastMouse && e.buttons === 1) {
-            panX += e.clientX - lastMouse.x;
-            panY += e.clientY - lastMouse.y;
-            lastMouse = { x: e.clientX, y: e.clientY };
+            panX += e.offsetX - lastMouse.x;
+            panY += e.offsetY - lastMouse.y;
+            lastMouse = { x: e.offsetX, y: e.offsetY };
+        } else {
+            return;
         }
+        wake();
     });
 
-    canvas.addEventListener('mouseup', () => { dragNode = null; lastMouse = null; });
+    // Pointer capture is released implicitly when the pointer goes up or
+    // is cancelled (e.g. a touch turned into a scroll)
+    function endDrag() {
+        // Moves after the last step would otherwise be lost on release
+        if (dragNode) pinNode(dragNode);
+        dragNode = null; lastMouse = null; wake();
+    }
+    canvas.addEventListener('pointerup', endDrag);
+    canvas.addEventListener('pointercancel', endDrag);
     canvas.addEventListener('wheel', e => {
         e.preventDefault();
         const factor = e.deltaY > 0 ? 0.9 : 1.1;
         scale *= factor;
         scale = Math.max(0.3, Math.min(3, scale));
+        wake();
     });
 
-    window._resetGraph = () => { panX = 0; panY = 0; scale = 1; };
+    function wake() {
+        dirty = true;
+        calmFrames = 0;
+        schedule();
+    }
+
+    window._resetGraph = () => { panX = 0; panY = 0; scale = 1; wake(); };
+    window._wakeGraph = wake;
+    window._resumeGraph = () => { dirty = true; schedule(); };
 
-    requestAnimationFrame(tick);
+    schedule();
 }
 
 function resetGraph() { if (window._resetGraph) window._resetGraph(); }
-function toggleLabels() { showLabels = !showLabels; }
-function togglePhysics() { physicsRunning = !physicsRunning; }
+function toggleLabels() { showLabels = !showLabels; if (window._wakeGraph) window._wakeGraph(); }
+function togglePhysics() { physicsRunning = !physicsRunning; if (window._wakeGraph) window._wakeGraph(); }
 
 // ============================================================================
 // LAYER ANALYSIS
 // ============================================================================
 function renderLayers() {
-    const grid = document.getElementById('layer-grid');
-    const layers = DATA.layers || [];
+    const grid = NODES.layerGrid;
+    const layers = getData().layers || [];
 
-    grid.innerHTML = layers.map(l => {
+    setHTML(grid, layers.map(l => {
         const isPrimary = l.is_primary_weakness;
         const rColor = riskColor(l.risk_score);
         const recs = (l.recommendations || []).map(r => {
@@ -678,11 +1089,11 @@ function renderLayers() {
             <div class="layer-stats">
                 <div class="layer-stat">
                     <div class="stat-label">Risk Score</div>
-                    <div class="stat-value" style="color:${rColor}">${pct(l.risk_score)}</div>
+                    <div class="stat-value" style="color:${rColor}">${pctMemo(l.risk_score)}</div>
                 </div>
                 <div class="layer-stat">
                     <div class="stat-label">Success Rate</div>
-                    <div class="stat-value">${pct(l.success_rate)}</div>
+                    <div class="stat-value">${pctMemo(l.success_rate)}</div>
                 </div>
                 <div class="layer-stat">
                     <div class="stat-label">Techniques</div>
@@ -694,20 +1105,34 @@ function renderLayers() {
                 </div>
             </div>
             <div class="progress-bar"><div class="progress-fill" style="width:${l.risk_score * 100}%;background:${rColor}"></div></div>
-            ${l.evidence_quality != null ? `<div style="font-size:12px;color:var(--text-muted)">Evidence quality: ${pct(l.evidence_quality)}</div>` : ''}
+            ${l.evidence_quality != null ? `<div style="font-size:12px;color:var(--text-muted)">Evidence quality: ${pctMemo(l.evidence_quality)}</div>` : ''}
             ${recs ? `<ul class="rec-list">${recs}</ul>` : ''}
         </div>`;
-    }).join('');
+    }).join(''));
 }
 
 // ============================================================================
 // RISK HEATMAP
 // ============================================================================
+// Cell backgrounds by success rate in whole percent. Rates are floored so a
+// cell never crosses the 50% tier boundary, and any nonzero rate stays amber.
+const HEAT_BG = new Array(101);
+for (let i = 0; i <= 100; i++) {
+    const r = i / 100;
+    HEAT_BG[i] = r >= 0.5 ? 'rgba(248,81,73,' + (0.2 + r * 0.6) + ')'
+        : r > 0 ? 'rgba(210,153,34,' + (0.2 + r * 0.4) + ')'
+        : 'rgba(63,185,80,0.15)';
+}
+
+function heatBg(rate) {
+    return HEAT_BG[rate > 0 ? Math.max(1, Math.min(100, Math.floor(rate * 100))) : 0];
+}
+
 function renderHeatmap() {
-    const body = document.getElementById('heatmap-body');
-    const heatmap = DATA.heatmap;
+    const body = NODES.heatmapBody;
+    const heatmap = getData().heatmap;
     if (!heatmap || !heatmap.surfaces || !heatmap.goals) {
-        body.innerHTML = '<p style="color:var(--text-muted);padding:20px">No heatmap data available.</p>';
+        setHTML(body, '<p style="color:var(--text-muted);padding:20px">No heatmap data available.</p>');
         return;
     }
 
@@ -715,33 +1140,44 @@ function renderHeatmap() {
     const goals = heatmap.goals;
     const matrix = heatmap.matrix; // surface -> goal -> { rate, count }
 
+    // Densify the nested matrix once into flat typed arrays indexed by
+    // (surface, goal); rates stay float64 so formatting is unchanged.
+    const nS = surfaces.length, nG = goals.length;
+    const rates = new Float64Array(nS * nG);
+    const counts = new Int32Array(nS * nG);
+    const successes = new Int32Array(nS * nG);
+    surfaces.forEach((s, i) => {
+        const row = matrix[s];
+        if (!row) return;
+        goals.forEach((g, j) => {
+            const cell = row[g];
+            if (!cell) return;
+            const k = i * nG + j;
+            rates[k] = cell.rate;
+            counts[k] = cell.count;
+            successes[k] = cell.successes;
+        });
+    });
+
     let html = '<table class="heatmap-table"><thead><tr><th></th>';
-    goals.forEach(g => { html += `<th>${esc(g)}</th>`; });
+    goals.forEach(g => { html += `<th>${escMemo(g)}</th>`; });
     html += '<th>Overall</th></tr></thead><tbody>';
 
-    surfaces.forEach(s => {
-        html += `<tr><td class="row-header">${esc(s)}</td>`;
+    surfaces.forEach((s, i) => {
+        html += `<tr><td class="row-header">${escMemo(s)}</td>`;
         let sTotal = 0, sSuccess = 0;
-        goals.forEach(g => {
-            const cell = (matrix[s] && matrix[s][g]) || { rate: -1, count: 0, successes: 0 };
-            if (cell.count > 0) {
-                const intensity = cell.rate;
-                const bg = intensity >= 0.5
-                    ? `rgba(248,81,73,${0.2 + intensity * 0.6})`
-                    : intensity > 0
-                    ? `rgba(210,153,34,${0.2 + intensity * 0.4})`
-                    : 'rgba(63,185,80,0.15)';
-                html += `<td style="background:${bg}">${pct(cell.rate)}<br><span style="font-size:10px;color:var(--text-muted)">(${cell.successes}/${cell.count})</span></td>`;
-                sTotal += cell.count; sSuccess += cell.successes;
+        for (let k = i * nG, end = k + nG; k < end; k++) {
+            if (counts[k] > 0) {
+                html += `<td style="background:${heatBg(rates[k])}">${pctMemo(rates[k])}<br><span style="font-size:10px;color:var(--text-muted)">(${successes[k]}/${counts[k]})</span></td>`;
+                sTotal += counts[k]; sSuccess += successes[k];
             } else {
                 html += `<td style="color:var(--text-muted)">-</td>`;
             }
-        });
+        }
         // Row total
         if (sTotal > 0) {
             const rate = sSuccess / sTotal;
-            const bg = rate >= 0.5 ? `rgba(248,81,73,${0.2 + rate * 0.6})` : rate > 0 ? `rgba(210,153,34,${0.2 + rate * 0.4})` : 'rgba(63,185,80,0.15)';
-            html += `<td style="background:${bg};font-weight:700">${pct(rate)}</td>`;
+            html += `<td style="background:${heatBg(rate)};font-weight:700">${pctMemo(rate)}</td>`;
         } else {
             html += `<td style="color:var(--text-muted)">-</td>`;
         }
@@ -749,57 +1185,77 @@ function renderHeatmap() {
     });
 
     html += '</tbody></table>';
-    body.innerHTML = html;
+    setHTML(body, html);
 }
 
 // ============================================================================
 // TECHNIQUE DETAILS TABLE
 // ============================================================================
 function renderTechniques() {
-    const techs = DATA.techniques || [];
-    document.getElementById('tech-count').textContent = `${techs.length} techniques`;
+    const techs = sortedTechniques();
+    NODES.techCount.textContent = `${techs.length} techniques`;
 
-    const thead = document.querySelector('#tech-table thead');
-    const tbody = document.querySelector('#tech-table tbody');
+    const thead = NODES.techThead;
+    const tbody = NODES.techTbody;
 
     thead.innerHTML = '<tr><th>ID</th><th>Name</th><th>Domain</th><th>Surface</th><th>Phase</th><th>Outcome</th><th>Score</th><th>ATLAS</th><th>Access</th><th>Cost</th></tr>';
 
-    tbody.innerHTML = techs.sort((a, b) => (b.score || 0) - (a.score || 0)).map(t => {
+    // Rows are cloned from a <template> and filled via textContent, then
+    // inserted in one go, so no row markup goes through the HTML parser.
+    const rowTpl = NODES.techRowTpl.content.firstElementChild;
+    const frag = document.createDocumentFragment();
+    techs.forEach(t => {
+        const row = rowTpl.cloneNode(true);
+        const cells = row.cells;
         const scorePct = ((t.score || 0) * 100).toFixed(0);
         const scoreColor = t.success === true ? 'var(--success)' : t.success === false ? 'var(--danger)' : 'var(--warning)';
-        const atlas = (t.atlas_refs || []).map(r => `<span class="badge badge-info">${esc(r)}</span>`).join(' ');
-
-        return `<tr>
-            <td><code style="font-size:11px;color:var(--cyan)">${esc(t.id)}</code></td>
-            <td>${esc(t.name)}</td>
-            <td><span class="badge badge-neutral">${esc(t.domain)}</span></td>
-            <td><span class="badge badge-neutral">${esc(t.surface)}</span></td>
-            <td><span class="badge badge-neutral">${esc(t.phase || '')}</span></td>
-            <td><span class="badge ${outcomeClass(t.success)}">${outcomeText(t.success)}</span></td>
-            <td>${scorePct}<span class="score-bar"><span class="score-fill" style="width:${scorePct}%;background:${scoreColor}"></span></span></td>
-            <td>${atlas || '-'}</td>
-            <td><span class="badge badge-neutral">${esc(t.access_required || '')}</span></td>
-            <td>${t.base_cost != null ? t.base_cost.toFixed(2) : '-'}</td>
-        </tr>`;
-    }).join('');
+
+        cells[0].firstChild.textContent = t.id ?? '';
+        cells[1].textContent = t.name ?? '';
+        cells[2].firstChild.textContent = t.domain ?? '';
+        cells[3].firstChild.textContent = t.surface ?? '';
+        cells[4].firstChild.textContent = t.phase || '';
+        cells[5].firstChild.classList.add(outcomeClass(t.success));
+        cells[5].firstChild.textContent = outcomeText(t.success);
+        cells[6].insertBefore(document.createTextNode(scorePct), cells[6].firstChild);
+        const fill = cells[6].lastChild.firstChild;
+        fill.style.width = scorePct + '%';
+        fill.style.background = scoreColor;
+        const refs = t.atlas_refs || [];
+        if (refs.length) {
+            refs.forEach((r, i) => {
+                if (i > 0) cells[7].appendChild(document.createTextNode(' '));
+                const badge = document.createElement('span');
+                badge.className = 'badge badge-info';
+                badge.textContent = r;
+                cells[7].appendChild(badge);
+            });
+        } else {
+            cells[7].textContent = '-';
+        }
+        cells[8].firstChild.textContent = t.access_required || '';
+        cells[9].textContent = t.base_cost != null ? t.base_cost.toFixed(2) : '-';
+        frag.appendChild(row);
+    });
+    tbody.replaceChildren(frag);
 }
 
 // ============================================================================
 // ATLAS MAPPING
 // ============================================================================
 function renderAtlas() {
-    const grid = document.getElementById('atlas-grid');
-    const atlasMap = DATA.atlas_mapping || {};
+    const grid = NODES.atlasGrid;
+    const entries = sortedAtlasEntries();
 
-    if (Object.keys(atlasMap).length === 0) {
-        grid.innerHTML = '<p style="color:var(--text-muted)">No ATLAS mappings available.</p>';
+    if (entries.length === 0) {
+        setHTML(grid, '<p style="color:var(--text-muted)">No ATLAS mappings available.</p>');
         return;
     }
 
-    grid.innerHTML = Object.entries(atlasMap).sort(([a], [b]) => a.localeCompare(b)).map(([atlasId, info]) => {
+    setHTML(grid, entries.map(([atlasId, info]) => {
         const tags = (info.techniques || []).map(t => {
             const cls = t.success === true ? 'badge-success' : t.success === false ? 'badge-danger' : 'badge-neutral';
-            return `<span class="badge ${cls}" style="margin:2px">${esc(t.name || t.id)}</span>`;
+            return `<span class="badge ${cls}" style="margin:2px">${escMemo(t.name || t.id)}</span>`;
         }).join('');
 
         return `<div class="atlas-card">
@@ -808,15 +1264,15 @@ function renderAtlas() {
             <div style="font-size:11px;color:var(--text-muted);margin-top:4px">${esc(info.tactic || '')}</div>
             <div class="atlas-techniques">${tags}</div>
         </div>`;
-    }).join('');
+    }).join(''));
 }
 
 // ============================================================================
 // STATISTICS
 // ============================================================================
 function renderStatistics() {
-    const grid = document.getElementById('stats-grid');
-    const s = DATA.statistics || {};
+    const grid = NODES.statsGrid;
+    const s = getData().statistics || {};
 
     const panels = [];
 
@@ -863,21 +1319,18 @@ function renderStatistics() {
         ).map(([k, v]) => [k.replace(/_/g, ' '), String(v)]) });
     }
 
-    grid.innerHTML = panels.map(p =>
+    setHTML(grid, panels.map(p =>
         `<div class="stat-panel"><h4>${esc(p.title)}</h4>` +
         p.rows.map(([k, v]) =>
             `<div class="stat-row"><span class="stat-key">${esc(String(k).replace(/_/g, ' '))}</span><span>${esc(String(v))}</span></div>`
         ).join('') +
         '</div>'
-    ).join('');
+    ).join(''));
 
     // Sensitivity Analysis
-    const sens = DATA.sensitivity;
+    const sens = getData().sensitivity;
     if (sens && sens.weights && sens.weights.length > 0) {
-        const sensPanel = document.createElement('div');
-        sensPanel.className = 'stat-panel';
-        sensPanel.style.gridColumn = '1 / -1';
-        let sensHtml = '<h4>Sensitivity Analysis</h4>';
+        let sensHtml = '<div class="stat-panel" style="grid-column:1 / -1"><h4>Sensitivity Analysis</h4>';
         sensHtml += '<p style="color:var(--text-secondary);margin-bottom:12px">Weight perturbation \u00b1' + ((sens.perturbation_pct || 0.2) * 100).toFixed(0) + '% (' + (sens.num_samples || 50) + ' samples). Higher rank correlation = more stable ranking.</p>';
         sensHtml += '<table class="data-table"><thead><tr><th>Weight</th><th>Rank Correlation (\u03c4)</th><th>Top-K Stability</th><th>Displaced Techniques</th></tr></thead><tbody>';
         sens.weights.forEach(w => {
@@ -887,34 +1340,45 @@ function renderStatistics() {
             sensHtml += '<tr><td><strong>' + esc(w.name.replace(/_/g, ' ')) + '</strong>' + isMost + isLeast + '</td>';
             sensHtml += '<td style="color:' + tauColor + ';font-weight:700">' + w.rank_correlation.toFixed(3) + '</td>';
             sensHtml += '<td>' + (w.top_k_stability * 100).toFixed(1) + '%</td>';
-            sensHtml += '<td style="font-size:12px">' + (w.displaced || []).join(', ') + '</td></tr>';
+            sensHtml += '<td style="font-size:12px">' + esc((w.displaced || []).join(', ')) + '</td></tr>';
         });
-        sensHtml += '</tbody></table>';
-        sensPanel.innerHTML = sensHtml;
-        grid.appendChild(sensPanel);
+        sensHtml += '</tbody></table></div>';
+        grid.append(htmlFragment(grid, sensHtml));
     }
 }
 
 // ============================================================================
 // BELIEF EVOLUTION
 // ============================================================================
+// Constant markup around each belief-table cell
+const BELIEF_CELL_OPEN = '<td style="color:';
+const BELIEF_CELL_MID = ';font-weight:600;font-size:12px">';
+const BELIEF_CELL_EMPTY = '<td style="color:var(--text-muted);font-size:12px">-</td>';
+const EMPTY = Object.freeze({});
+
 function renderBeliefs() {
-    const panel = document.getElementById('beliefs-panel');
-    const history = DATA.posterior_evolution;
+    const panel = NODES.beliefsPanel;
+    const history = getData().posterior_evolution;
     if (!history || !history.length) {
         panel.innerHTML = '<div class="panel"><div class="panel-header"><h3>Belief Evolution</h3></div><p style="padding:16px;color:var(--text-secondary)">No posterior evolution data available. Run an adaptive campaign to see belief changes over time.</p></div>';
         return;
     }
     let html = '<div class="panel"><div class="panel-header"><h3>Posterior Belief Evolution</h3><span style="font-size:14px;color:var(--text-muted)">' + history.length + ' snapshots</span></div>';
 
-    // Collect all technique IDs across history
-    const allTechIds = new Set();
-    history.forEach(snap => {
-        Object.keys(snap.posteriors || {}).forEach(tid => allTechIds.add(tid));
-    });
+    // Columns are the first 15 technique IDs in order of appearance (limited
+    // for readability); once that many are seen later snapshots can't change them.
+    const MAX_COLUMNS = 15;
+    const seenTechIds = new Set();
+    for (const snap of history) {
+        for (const tid in snap.posteriors || EMPTY) {
+            seenTechIds.add(tid);
+            if (seenTechIds.size === MAX_COLUMNS) break;
+        }
+        if (seenTechIds.size === MAX_COLUMNS) break;
+    }
 
     // Build table: rows = steps, columns = techniques
-    const techIds = Array.from(allTechIds).slice(0, 15); // Limit to 15 for readability
+    const techIds = Array.from(seenTechIds);
     html += '<div style="overflow-x:auto;padding:0 16px 16px"><table class="data-table"><thead><tr><th>Step</th><th>Phase</th>';
     techIds.forEach(tid => {
         const shortId = tid.split('-').slice(-2).join('-');
@@ -922,20 +1386,33 @@ function renderBeliefs() {
     });
     html += '</tr></thead><tbody>';
 
-    history.forEach(snap => {
-        html += '<tr><td>' + (snap.step || 0) + '</td><td>' + esc(snap.phase || '') + '</td>';
-        techIds.forEach(tid => {
-            const post = (snap.posteriors || {})[tid];
-            if (post) {
-                const mean = (post.mean || 0);
+    // One typed column of posterior means per technique (NaN = no posterior),
+    // filled in a single pass and shared by the table and the chart
+    const steps = history.length;
+    const series = techIds.map(() => new Float64Array(steps).fill(NaN));
+    history.forEach((snap, si) => {
+        const posteriors = snap.posteriors || EMPTY;
+        techIds.forEach((tid, ti) => {
+            const post = posteriors[tid];
+            if (post && post.mean !== undefined) series[ti][si] = post.mean || 0;
+        });
+    });
+
+    const rows = [];
+    history.forEach((snap, si) => {
+        rows.push('<tr><td>' + (snap.step || 0) + '</td><td>' + escMemo(snap.phase || '') + '</td>');
+        series.forEach(col => {
+            const mean = col[si];
+            if (!Number.isNaN(mean)) {
                 const color = mean >= 0.6 ? 'var(--danger)' : mean >= 0.3 ? 'var(--warning)' : 'var(--success)';
-                html += '<td style="color:' + color + ';font-weight:600;font-size:12px">' + mean.toFixed(2) + '</td>';
+                rows.push(BELIEF_CELL_OPEN + color + BELIEF_CELL_MID + mean.toFixed(2) + '</td>');
             } else {
-                html += '<td style="color:var(--text-muted);font-size:12px">-</td>';
+                rows.push(BELIEF_CELL_EMPTY);
             }
         });
-        html += '</tr>';
+        rows.push('</tr>');
     });
+    html += rows.join('');
 
     html += '</tbody></table></div>';
 
@@ -944,15 +1421,48 @@ function renderBeliefs() {
     html += '</div>';
     panel.innerHTML = html;
 
-    // Draw simple line chart on canvas
+    // Draw simple line chart on canvas, off the main thread when possible
     const canvas = document.getElementById('beliefs-chart');
     if (!canvas) return;
-    const ctx = canvas.getContext('2d');
-    const w = canvas.width, h = canvas.height;
+    const lines = series.slice(0, 10);
+    if (typeof OffscreenCanvas !== 'undefined' && canvas.transferControlToOffscreen) {
+        try {
+            const src = `const drawBeliefChart = ${drawBeliefChart};
+self.onmessage = e => {
+    const m = e.data;
+    drawBeliefChart(m.canvas.getContext('2d'), m.canvas.width, m.canvas.height, m.series, m.steps);
+    self.postMessage(true);
+};`;
+            const url = URL.createObjectURL(new Blob([src], { type: 'text/javascript' }));
+            let worker;
+            try {
+                worker = new Worker(url);
+            } finally {
+                URL.revokeObjectURL(url);
+            }
+            const off = canvas.transferControlToOffscreen();
+            worker.onmessage = () => worker.terminate();
+            worker.onerror = () => {
+                // The transferred canvas is gone for good; draw on a fresh one
+                worker.terminate();
+                const fresh = canvas.cloneNode(false);
+                canvas.parentNode.replaceChild(fresh, canvas);
+                drawBeliefChart(fresh.getContext('2d'), fresh.width, fresh.height, lines, steps);
+            };
+            worker.postMessage({ canvas: off, series: lines, steps }, [off]);
+            return;
+        } catch (err) {
+            // Worker construction refused; fall through to the inline draw
+        }
+    }
+    drawBeliefChart(canvas.getContext('2d'), canvas.width, canvas.height, lines, steps);
+}
+
+// Self-contained so its source can be shipped to a worker as-is
+function drawBeliefChart(ctx, w, h, series, steps) {
     const pad = {top: 20, right: 20, bottom: 30, left: 40};
     const plotW = w - pad.left - pad.right;
     const plotH = h - pad.top - pad.bottom;
-    const steps = history.length;
 
     // Colors for different techniques
     const colors = ['#3b82f6','#ef4444','#22c55e','#f59e0b','#8b5cf6','#ec4899','#06b6d4','#84cc16','#f97316','#6366f1'];
@@ -981,20 +1491,19 @@ function renderBeliefs() {
     });
 
     // Draw lines for each technique
-    techIds.slice(0, 10).forEach((tid, idx) => {
+    series.forEach((col, idx) => {
         ctx.strokeStyle = colors[idx % colors.length];
         ctx.lineWidth = 1.5;
         ctx.beginPath();
         let started = false;
-        history.forEach((snap, si) => {
-            const post = (snap.posteriors || {})[tid];
-            if (post && post.mean !== undefined) {
-                const x = pad.left + (si / Math.max(steps - 1, 1)) * plotW;
-                const y = pad.top + plotH * (1 - post.mean);
-                if (!started) { ctx.moveTo(x, y); started = true; }
-                else ctx.lineTo(x, y);
-            }
-        });
+        for (let si = 0; si < steps; si++) {
+            const mean = col[si];
+            if (Number.isNaN(mean)) continue;
+            const x = pad.left + (si / Math.max(steps - 1, 1)) * plotW;
+            const y = pad.top + plotH * (1 - mean);
+            if (!started) { ctx.moveTo(x, y); started = true; }
+            else ctx.lineTo(x, y);
+        }
         ctx.stroke();
     });
 }
@@ -1002,71 +1511,128 @@ function renderBeliefs() {
 // ============================================================================
 // COMPLIANCE
 // ============================================================================
+// Inline background for each control's risk badge
+const RISK_BADGE_STYLE = {
+    high: 'background:var(--danger)',
+    moderate: 'background:var(--warning)',
+    low: 'background:var(--success)',
+};
+
 function renderCompliance() {
-    const panel = document.getElementById('compliance-panel');
-    const summaries = DATA.compliance || [];
+    const panel = NODES.compliancePanel;
+    const summaries = getData().compliance || [];
     if (!summaries.length) {
-        panel.innerHTML = '<div class="panel"><div class="panel-header"><h3>Compliance Frameworks</h3></div><p style="padding:16px;color:var(--text-secondary)">No compliance data available. Add compliance_refs to techniques in catalog.</p></div>';
+        setHTML(panel, '<div class="panel"><div class="panel-header"><h3>Compliance Frameworks</h3></div><p style="padding:16px;color:var(--text-secondary)">No compliance data available. Add compliance_refs to techniques in catalog.</p></div>');
         return;
     }
-    let html = '';
+    const parts = [];
     summaries.forEach(fw => {
         const pct = (fw.coverage_pct * 100).toFixed(0);
         const color = pct >= 80 ? 'var(--success)' : pct >= 50 ? 'var(--warning)' : 'var(--danger)';
-        html += '<div class="panel"><div class="panel-header"><h3>' + esc(fw.framework_name || fw.framework) + '</h3><span style="font-size:14px;color:' + color + ';font-weight:700">' + fw.tested_controls + '/' + fw.total_controls + ' controls tested (' + pct + '%)</span></div>';
+        parts.push('<div class="panel"><div class="panel-header"><h3>' + esc(fw.framework_name || fw.framework) + '</h3><span style="font-size:14px;color:' + color + ';font-weight:700">' + fw.tested_controls + '/' + fw.total_controls + ' controls tested (' + pct + '%)</span></div>');
         // Progress bar
-        html += '<div style="background:var(--bg-tertiary);border-radius:4px;height:8px;margin:0 16px 16px"><div style="background:' + color + ';height:100%;border-radius:4px;width:' + pct + '%;transition:width 0.3s"></div></div>';
+        parts.push('<div style="background:var(--bg-tertiary);border-radius:4px;height:8px;margin:0 16px 16px"><div style="background:' + color + ';height:100%;border-radius:4px;width:' + pct + '%;transition:width 0.3s"></div></div>');
         // Control table
-        html += '<table class="data-table"><thead><tr><th>Control</th><th>Name</th><th>Techniques Mapped</th><th>Tested</th><th>Risk</th></tr></thead><tbody>';
+        parts.push('<table class="data-table"><thead><tr><th>Control</th><th>Name</th><th>Techniques Mapped</th><th>Tested</th><th>Risk</th></tr></thead><tbody>');
         (fw.control_results || []).forEach(c => {
-            const badge = c.risk_level === 'high' ? 'background:var(--danger)' : c.risk_level === 'moderate' ? 'background:var(--warning)' : c.risk_level === 'low' ? 'background:var(--success)' : 'background:var(--text-muted)';
-            html += '<tr><td><strong>' + esc(c.control_id) + '</strong></td><td>' + esc(c.control_name) + '</td><td>' + (c.techniques_mapped || []).length + '</td><td>' + (c.techniques_tested || []).length + '</td><td><span class="badge" style="' + badge + '">' + esc(c.risk_level) + '</span></td></tr>';
+            const badge = RISK_BADGE_STYLE[c.risk_level] || 'background:var(--text-muted)';
+            parts.push('<tr><td><strong>' + esc(c.control_id) + '</strong></td><td>' + esc(c.control_name) + '</td><td>' + (c.techniques_mapped || []).length + '</td><td>' + (c.techniques_tested || []).length + '</td><td><span class="badge" style="' + badge + '">' + esc(c.risk_level) + '</span></td></tr>');
         });
-        html += '</tbody></table></div>';
+        parts.push('</tbody></table></div>');
     });
-    panel.innerHTML = html;
+    setHTML(panel, parts.join(''));
 }
 
 // ============================================================================
 // RAW DATA
 // ============================================================================
 function renderRawData() {
-    document.getElementById('raw-data').textContent = JSON.stringify(DATA, null, 2);
+    const pre = NODES.rawData;
+    const embedded = NODES.apData.textContent;
+    // A payload rendered with pretty=True is already indented: show it as-is,
+    // undoing only the emitter's "<\/" escape.
+    if (embedded.startsWith('{\n')) {
+        pre.textContent = embedded.replace(/<\\\//g, '</');
+        return;
+    }
+    // Otherwise format one top-level key at a time in idle slices, producing
+    // exactly what JSON.stringify(data, null, 2) would.
+    const idle = window.requestIdleCallback || (cb => setTimeout(cb, 1));
+    const data = getData();
+    const keys = Object.keys(data);
+    if (!keys.length) { pre.textContent = '{}'; return; }
+    pre.textContent = '{\n';
+    pre.setAttribute('aria-busy', 'true');
+    let i = 0;
+    idle(function formatSlice(deadline) {
+        do {
+            const k = keys[i++];
+            const value = JSON.stringify(data[k], null, 2).replace(/\n/g, '\n  ');
+            pre.append('  ' + JSON.stringify(k) + ': ' + value + (i < keys.length ? ',\n' : '\n}'));
+        } while (i < keys.length && deadline && deadline.timeRemaining() > 1);
+        if (i < keys.length) idle(formatSlice);
+        else pre.removeAttribute('aria-busy');
+    });
 }
 
 // ============================================================================
 // TAB SWITCHING
 // ============================================================================
-let graphInitialized = false;
-document.querySelectorAll('.tab-btn').forEach(btn => {
+// Each panel is rendered the first time its tab is opened, so tabs the
+// reader never visits cost nothing.
+const TAB_RENDERERS = {
+    executive: renderExecutive,
+    graph: () => setTimeout(initGraph, 50),
+    layers: renderLayers,
+    heatmap: renderHeatmap,
+    techniques: renderTechniques,
+    atlas: renderAtlas,
+    compliance: renderCompliance,
+    beliefs: renderBeliefs,
+    statistics: renderStatistics,
+    rawdata: renderRawData,
+};
+const renderedTabs = new Set();
+
+function ensureRendered(tab) {
+    if (renderedTabs.has(tab)) return false;
+    renderedTabs.add(tab);
+    if (TAB_RENDERERS[tab]) TAB_RENDERERS[tab]();
+    return true;
+}
+
+NODES.tabButtons.forEach(btn => {
     btn.addEventListener('click', function() {
-        document.querySelectorAll('.tab-btn').forEach(b => b.classList.remove('active'));
-        document.querySelectorAll('.tab-panel').forEach(p => p.classList.remove('active'));
+        NODES.tabButtons.forEach(b => b.classList.remove('active'));
+        NODES.tabPanels.forEach(p => p.classList.remove('active'));
         this.classList.add('active');
         const panel = document.getElementById(this.dataset.tab + '-panel');
         if (panel) panel.classList.add('active');
 
-        if (this.dataset.tab === 'graph' && !graphInitialized) {
-            graphInitialized = true;
-            setTimeout(initGraph, 50);
+        graphVisible = this.dataset.tab === 'graph';
+        if (!ensureRendered(this.dataset.tab) && graphVisible && window._resumeGraph) {
+            window._resumeGraph();
         }
-        if (this.dataset.tab === 'rawdata') renderRawData();
     });
 });
 
+document.addEventListener('visibilitychange', () => {
+    if (!document.hidden && graphVisible && window._resumeGraph) window._resumeGraph();
+});
+
 // ============================================================================
 // INITIALIZE
 // ============================================================================
-renderHeader();
-renderSummary();
-renderExecutive();
-renderLayers();
-renderHeatmap();
-renderTechniques();
-renderAtlas();
-renderStatistics();
-renderCompliance();
-renderBeliefs();
+// First paint is a single frame-aligned batch; every other tab renders
+// on first activation through ensureRendered().
+requestAnimationFrame(() => {
+    renderHeader();
+    renderSummary();
+    ensureRendered('executive');
+});
 </script>
 </body>
 </html>"""
+
+# Minified once at import; every rendered report embeds the compact stylesheet.
+HTML_TEMPLATE = _TEMPLATE_SOURCE.replace("{{STYLE}}", _minify_css(_STYLE))
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import io
 from typing import Any
 
 from adversarypilot.models.report import DefenderReport
@@ -17,92 +17,81 @@ class ReportRenderer:
 
     def to_dict(self, report: DefenderReport) -> dict[str, Any]:
         """Render report as a dictionary."""
-        return json.loads(report.model_dump_json())
+        return report.model_dump(mode="json")
 
     def to_markdown(self, report: DefenderReport) -> str:
         """Render report as a markdown string."""
-        lines = []
-        lines.append(f"# Defender Report: {report.target_profile.name}")
-        lines.append("")
-        lines.append(f"**Campaign:** {report.campaign_id}")
-        lines.append(f"**Generated:** {report.generated_at.isoformat()}")
-        lines.append(f"**Target Type:** {report.target_profile.target_type.value}")
-        lines.append(f"**Access Level:** {report.target_profile.access_level.value}")
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        target = report.target_profile
+        w(f"# Defender Report: {target.name}\n\n")
+        w(f"**Campaign:** {report.campaign_id}\n")
+        w(f"**Generated:** {report.generated_at.isoformat()}\n")
+        w(f"**Target Type:** {target.target_type.value}\n")
+        w(f"**Access Level:** {target.access_level.value}\n\n")
 
         # Risk summary
-        lines.append("## Risk Summary")
-        lines.append("")
+        w("## Risk Summary\n\n")
         if report.primary_weak_layer:
-            lines.append(
-                f"**Primary Weakness:** {report.primary_weak_layer.value} layer"
-            )
+            w(f"**Primary Weakness:** {report.primary_weak_layer.value} layer\n")
         if report.secondary_weak_layers:
             secondary = ", ".join(l.value for l in report.secondary_weak_layers)
-            lines.append(f"**Secondary Concerns:** {secondary}")
-        lines.append("")
+            w(f"**Secondary Concerns:** {secondary}\n")
+        w("\n")
         if report.overall_risk_summary:
-            lines.append(report.overall_risk_summary)
-            lines.append("")
+            w(f"{report.overall_risk_summary}\n\n")
 
         # Layer assessments
-        lines.append("## Layer Assessments")
-        lines.append("")
+        w("## Layer Assessments\n\n")
         for assessment in report.layer_assessments:
             status = "INSUFFICIENT DATA" if assessment.is_insufficient_evidence else ""
             primary = " (PRIMARY WEAKNESS)" if assessment.is_primary_weakness else ""
-            lines.append(
+            w(
                 f"### {assessment.layer.value.title()} Layer "
-                f"(risk: {assessment.risk_score:.2f}){primary} {status}"
+                f"(risk: {assessment.risk_score:.2f}){primary} {status}\n\n"
             )
-            lines.append("")
 
             ev = assessment.evidence
-            lines.append(
-                f"- **Attempts:** {ev.total_attempts} "
-                f"({ev.success_count} succeeded)"
-            )
-            lines.append(
-                f"- **Success Rate (smoothed):** {ev.smoothed_success_rate:.1%}"
-            )
             ci_lo, ci_hi = ev.confidence_interval
-            lines.append(f"- **95% CI:** [{ci_lo:.1%}, {ci_hi:.1%}]")
-            lines.append(f"- **Evidence Quality:** {ev.evidence_quality:.2f}")
+            w(
+                f"- **Attempts:** {ev.total_attempts} ({ev.success_count} succeeded)\n"
+                f"- **Success Rate (smoothed):** {ev.smoothed_success_rate:.1%}\n"
+                f"- **95% CI:** [{ci_lo:.1%}, {ci_hi:.1%}]\n"
+                f"- **Evidence Quality:** {ev.evidence_quality:.2f}\n"
+            )
 
             if ev.caveats:
-                lines.append("- **Caveats:**")
+                w("- **Caveats:**\n")
                 for caveat in ev.caveats:
-                    lines.append(f"  - {caveat}")
+                    w(f"  - {caveat}\n")
 
             if assessment.techniques_tested:
-                lines.append(
-                    f"- **Techniques Tested:** {', '.join(assessment.techniques_tested)}"
-                )
+                w(f"- **Techniques Tested:** {', '.join(assessment.techniques_tested)}\n")
 
             if assessment.recommendations:
-                lines.append("- **Recommendations:**")
+                w("- **Recommendations:**\n")
                 for rec in assessment.recommendations:
-                    lines.append(f"  - {rec}")
+                    w(f"  - {rec}\n")
 
-            lines.append("")
+            w("\n")
 
         # Comparability warnings
         if report.comparability_warnings:
-            lines.append("## Comparability Warnings")
-            lines.append("")
+            w("## Comparability Warnings\n\n")
             for warning in report.comparability_warnings:
-                lines.append(f"- {warning}")
-            lines.append("")
+                w(f"- {warning}\n")
+            w("\n")
 
         # Next steps
         if report.next_recommended_tests:
-            lines.append("## Recommended Next Tests")
-            lines.append("")
+            w("## Recommended Next Tests\n\n")
             for tid in report.next_recommended_tests:
-                lines.append(f"- {tid}")
-            lines.append("")
+                w(f"- {tid}\n")
+            w("\n")
 
-        return "\n".join(lines)
+        # Every section closes with a blank line; the document ends one
+        # newline earlier than that
+        return buf.getvalue()[:-1]
 
     def to_terminal(self, report: DefenderReport) -> str:
         """Render report for terminal output using Rich-compatible formatting."""
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import json
+from collections import defaultdict
 from pathlib import Path
+from typing import Any
 
 import yaml
 
 from adversarypilot.models.enums import AccessLevel, Domain, Goal, Phase, Surface, TargetType
-from adversarypilot.models.technique import AtlasReference, AttackTechnique, ComplianceReference
+from adversarypilot.models.technique import AttackTechnique
+
+try:  # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
 
 _DEFAULT_CATALOG = Path(__file__).parent / "catalog.yaml"
 
@@ -17,32 +25,72 @@ class TechniqueRegistry:
 
     def __init__(self) -> None:
         self._techniques: dict[str, AttackTechnique] = {}
+        self._all: tuple[AttackTechnique, ...] | None = None
+        self._by_id: dict[str, AttackTechnique] | None = None
+        self._index: dict[str, dict[Any, set[str]]] | None = None
+        self._order: dict[str, int] = {}
 
     def load_catalog(self, path: Path | None = None) -> None:
-        """Load techniques from a YAML catalog file."""
-        path = path or _DEFAULT_CATALOG
+        """Load techniques from a YAML (or pre-converted .json) catalog file."""
+        path = Path(path or _DEFAULT_CATALOG)
+        self._all = None
+        self._by_id = None
+        self._index = None
         with open(path) as f:
-            data = yaml.safe_load(f)
+            if path.suffix == ".json":
+                data = json.load(f)
+            else:
+                data = yaml.load(f, Loader=_SafeLoader)
 
+        # One model_validate per entry lets pydantic-core build the nested
+        # reference models itself instead of constructing them in Python.
         for entry in data.get("techniques", []):
-            atlas_refs = [
-                AtlasReference(**ref) for ref in entry.pop("atlas_refs", [])
-            ]
-            compliance_refs = [
-                ComplianceReference(**ref) for ref in entry.pop("compliance_refs", [])
-            ]
-            technique = AttackTechnique(
-                atlas_refs=atlas_refs, compliance_refs=compliance_refs, **entry
-            )
+            technique = AttackTechnique.model_validate(entry)
             self._techniques[technique.id] = technique
 
     def get(self, technique_id: str) -> AttackTechnique | None:
         """Get a technique by ID."""
         return self._techniques.get(technique_id)
 
-    def get_all(self) -> list[AttackTechnique]:
-        """Return all registered techniques."""
-        return list(self._techniques.values())
+    def get_all(self) -> tuple[AttackTechnique, ...]:
+        """Return all registered techniques, cached until the next load_catalog()."""
+        if self._all is None:
+            self._all = tuple(self._techniques.values())
+        return self._all
+
+    def get_all_by_id(self) -> dict[str, AttackTechnique]:
+        """Return an ID -> technique map, cached until the next load_catalog().
+
+        The returned dict is shared between callers and must not be mutated.
+        """
+        if self._by_id is None:
+            self._by_id = dict(self._techniques)
+        return self._by_id
+
+    def _build_index(self) -> dict[str, dict[Any, set[str]]]:
+        """Build per-axis inverted indices (axis -> value -> technique IDs)."""
+        index: dict[str, dict[Any, set[str]]] = {
+            axis: defaultdict(set)
+            for axis in (
+                "domain", "phase", "surface", "access_level",
+                "goal", "target_type", "tool", "framework",
+            )
+        }
+        for t in self._techniques.values():
+            index["domain"][t.domain].add(t.id)
+            index["phase"][t.phase].add(t.id)
+            index["surface"][t.surface].add(t.id)
+            index["access_level"][t.access_required].add(t.id)
+            for goal in t.goals_supported:
+                index["goal"][goal].add(t.id)
+            for target_type in t.target_types:
+                index["target_type"][target_type].add(t.id)
+            for tool in t.tool_support:
+                index["tool"][tool].add(t.id)
+            for ref in t.compliance_refs:
+                index["framework"][ref.framework].add(t.id)
+        self._order = {tid: i for i, tid in enumerate(self._techniques)}
+        return {axis: dict(by_value) for axis, by_value in index.items()}
 
     def filter(
         self,
@@ -56,30 +104,41 @@ class TechniqueRegistry:
         tool: str | None = None,
         framework: str | None = None,
     ) -> list[AttackTechnique]:
-        """Filter techniques by any combination of taxonomy axes."""
-        results = self.get_all()
-
-        if domain is not None:
-            results = [t for t in results if t.domain == domain]
-        if phase is not None:
-            results = [t for t in results if t.phase == phase]
-        if surface is not None:
-            results = [t for t in results if t.surface == surface]
-        if access_level is not None:
-            results = [t for t in results if t.access_required == access_level]
-        if goal is not None:
-            results = [t for t in results if goal in t.goals_supported]
-        if target_type is not None:
-            results = [t for t in results if target_type in t.target_types]
-        if tool is not None:
-            results = [t for t in results if tool in t.tool_support]
-        if framework is not None:
-            results = [
-                t for t in results
-                if any(ref.framework == framework for ref in t.compliance_refs)
-            ]
-
-        return results
+        """Filter techniques by any combination of taxonomy axes.
+
+        Criteria are resolved against inverted indices built on first use and
+        intersected; results keep catalog order.
+        """
+        criteria = {
+            "domain": domain,
+            "phase": phase,
+            "surface": surface,
+            "access_level": access_level,
+            "goal": goal,
+            "target_type": target_type,
+            "tool": tool,
+            "framework": framework,
+        }
+        if self._index is None:
+            self._index = self._build_index()
+
+        candidates: set[str] | None = None
+        for axis, value in criteria.items():
+            if value is None:
+                continue
+            ids = self._index[axis].get(value)
+            if not ids:
+                return []
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        if candidates is None:
+            return list(self.get_all())
+        return [
+            self._techniques[tid]
+            for tid in sorted(candidates, key=self._order.__getitem__)
+        ]
 
     def __len__(self) -> int:
         return len(self._techniques)
@@ -2,6 +2,7 @@
 
 from adversarypilot.utils.hashing import (
     derive_comparable_group_key,
+    derive_comparable_group_keys,
     hash_success_criteria,
     hash_target_profile,
     hash_technique_config,
@@ -14,4 +15,5 @@ __all__ = [
     "hash_technique_config",
     "hash_success_criteria",
     "derive_comparable_group_key",
+    "derive_comparable_group_keys",
 ]
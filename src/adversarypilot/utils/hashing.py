@@ -2,25 +2,64 @@
 
 import hashlib
 import json
-from typing import Any
+import mmap
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from adversarypilot.models.enums import JudgeType
 
+if TYPE_CHECKING:
+    from adversarypilot.models.results import ComparabilityMetadata
+    from adversarypilot.models.target import TargetProfile
+    from adversarypilot.models.technique import TechniqueExecutionSpec
+
+# Files larger than this are memory-mapped rather than read in chunks
+_MMAP_THRESHOLD = 1 << 20
+
+
+# The models import adversarypilot.utils, so the classes needed for runtime
+# isinstance checks are imported on first use and cached.
+@lru_cache(maxsize=1)
+def _target_profile_cls() -> "type[TargetProfile]":
+    from adversarypilot.models.target import TargetProfile
+
+    return TargetProfile
+
+
+@lru_cache(maxsize=1)
+def _comparability_metadata_cls() -> "type[ComparabilityMetadata]":
+    from adversarypilot.models.results import ComparabilityMetadata
+
+    return ComparabilityMetadata
+
+
+@lru_cache(maxsize=1024)
+def _digest(canonical: str) -> str:
+    """SHA256 of a canonical JSON string, memoized for repeated inputs.
+
+    json.dumps escapes non-ASCII by default, so the string is pure ASCII and
+    encodes with a straight copy.
+    """
+    return hashlib.sha256(canonical.encode("ascii")).digest()[:8].hex()
+
 
 def _stable_hash(data: dict[str, Any]) -> str:
     """Generate stable SHA256 hash from dictionary.
 
+    The same target, technique and judge settings are hashed for every
+    result in a campaign, so digests are cached by canonical JSON.
+
     Args:
         data: Dictionary to hash (must be JSON-serializable)
 
     Returns:
         str: First 16 characters of hex digest
     """
-    json_str = json.dumps(data, sort_keys=True, separators=(",", ":"))
-    return hashlib.sha256(json_str.encode("utf-8")).hexdigest()[:16]
+    return _digest(json.dumps(data, sort_keys=True, separators=(",", ":")))
 
 
-def hash_target_profile(target: "TargetProfile") -> str:  # noqa: F821
+def hash_target_profile(target: "TargetProfile") -> str:
     """Hash target profile for comparability grouping.
 
     Includes: target_type, access_level, goals, defense profile, constraints.
@@ -31,9 +70,7 @@ def hash_target_profile(target: "TargetProfile") -> str:  # noqa: F821
     Returns:
         str: Deterministic hash string
     """
-    from adversarypilot.models.target import TargetProfile
-
-    if not isinstance(target, TargetProfile):
+    if not isinstance(target, _target_profile_cls()):
         return ""
 
     data = {
@@ -47,7 +84,7 @@ def hash_target_profile(target: "TargetProfile") -> str:  # noqa: F821
 
 
 def hash_technique_config(
-    technique_id: str, exec_spec: "TechniqueExecutionSpec | None" = None  # noqa: F821
+    technique_id: str, exec_spec: "TechniqueExecutionSpec | None" = None
 ) -> str:
     """Hash technique configuration for comparability grouping.
 
@@ -60,21 +97,37 @@ def hash_technique_config(
     Returns:
         str: Deterministic hash string
     """
-    data = {"technique_id": technique_id}
-
-    if exec_spec is not None:
-        data.update(
-            {
-                "query_budget": exec_spec.query_budget,
-                "prompt_set": exec_spec.prompt_set,
-                "seed": exec_spec.seed,
-                "judge_config": exec_spec.judge_config,
-            }
-        )
+    if exec_spec is None:
+        return _hash_technique_id(technique_id)
 
+    data = {
+        "technique_id": technique_id,
+        "query_budget": exec_spec.query_budget,
+        "prompt_set": exec_spec.prompt_set,
+        "seed": exec_spec.seed,
+        "judge_config": exec_spec.judge_config,
+    }
     return _stable_hash(data)
 
 
+@lru_cache(maxsize=4096)
+def _hash_technique_id(technique_id: str) -> str:
+    """hash_technique_config() without an exec spec, cached per technique ID."""
+    return _stable_hash({"technique_id": technique_id})
+
+
+# judge_config fields that affect success determination
+_SUCCESS_CRITERIA_KEYS = (
+    "threshold",
+    "criteria",
+    "model",
+    "prompt_template",
+    "temperature",
+    "keywords",
+    "patterns",
+)
+
+
 def hash_success_criteria(judge_type: JudgeType, judge_config: dict[str, Any]) -> str:
     """Hash success criteria for comparability grouping.
 
@@ -88,20 +141,7 @@ def hash_success_criteria(judge_type: JudgeType, judge_config: dict[str, Any]) -
         str: Deterministic hash string
     """
     # Filter judge_config to only include fields that affect success determination
-    relevant_config = {
-        k: v
-        for k, v in judge_config.items()
-        if k
-        in {
-            "threshold",
-            "criteria",
-            "model",
-            "prompt_template",
-            "temperature",
-            "keywords",
-            "patterns",
-        }
-    }
+    relevant_config = {k: judge_config[k] for k in _SUCCESS_CRITERIA_KEYS if k in judge_config}
 
     data = {"judge_type": judge_type, "config": relevant_config}
     return _stable_hash(data)
@@ -116,11 +156,13 @@ def hash_file(path: str) -> str:
     Returns:
         str: First 16 characters of hex digest
     """
-    h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
-    return h.hexdigest()[:16]
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            # Hash the whole mapping in one update() call, which runs without
+            # the GIL, instead of copying it through read buffers
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).digest()[:8].hex()
+        return hashlib.file_digest(f, "sha256").digest()[:8].hex()
 
 
 def compute_reproducibility_token(
@@ -146,7 +188,11 @@ def compute_reproducibility_token(
     return _stable_hash(combined)
 
 
-def derive_comparable_group_key(comparability: "ComparabilityMetadata") -> str:  # noqa: F821
+# Fields of ComparabilityMetadata that determine its group key
+_GroupFields = tuple[str | None, ...]
+
+
+def derive_comparable_group_key(comparability: "ComparabilityMetadata") -> str:
     """Derive canonical comparable group key from comparability metadata.
 
     Results with the same group key can be directly compared.
@@ -158,9 +204,7 @@ def derive_comparable_group_key(comparability: "ComparabilityMetadata") -> str:
     Returns:
         str: Canonical group key
     """
-    from adversarypilot.models.results import ComparabilityMetadata
-
-    if not isinstance(comparability, ComparabilityMetadata):
+    if not isinstance(comparability, _comparability_metadata_cls()):
         return ""
 
     # Warn if critical fields are missing
@@ -185,3 +229,41 @@ def derive_comparable_group_key(comparability: "ComparabilityMetadata") -> str:
     }
 
     return _stable_hash(data)
+
+
+def derive_comparable_group_keys(
+    items: "list[ComparabilityMetadata]",
+) -> list[str]:
+    """Derive group keys for a batch of comparability metadata.
+
+    Results in one ingest mostly share target, technique config and judge
+    settings, so each distinct combination is hashed once. The
+    incomplete-metadata check in derive_comparable_group_key() also runs
+    once per combination, not once per item.
+
+    Args:
+        items: ComparabilityMetadata entries to derive keys for
+
+    Returns:
+        list[str]: Group keys in input order ("" where metadata is incomplete
+        or an item is not ComparabilityMetadata)
+    """
+    metadata_cls = _comparability_metadata_cls()
+    keys: dict[_GroupFields, str] = {}
+    result = []
+    for comparability in items:
+        if not isinstance(comparability, metadata_cls):
+            result.append("")
+            continue
+        fields = (
+            comparability.target_profile_hash,
+            comparability.technique_config_hash,
+            comparability.judge_type,
+            comparability.success_criteria_hash,
+            comparability.judge_model_version,
+        )
+        key = keys.get(fields)
+        if key is None:
+            key = keys[fields] = derive_comparable_group_key(comparability)
+        result.append(key)
+    return result
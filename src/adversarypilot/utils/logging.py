@@ -1,8 +1,37 @@
-"""Structured logging configuration for AdversaryPilot."""
+"""Structured logging configuration for AdversaryPilot.
 
+Pass values as %-style arguments rather than pre-formatting them::
+
+    logger.debug("Scored %d techniques for %s", len(scores), target.name)
+
+The message is then only formatted if a handler actually emits it. For
+arguments that are costly to compute, guard the call with
+``logger.isEnabledFor(logging.DEBUG)``.
+"""
+
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
 import sys
 
+# Loggers are never destroyed, so each name can be resolved once; this skips
+# the logging module lock taken by logging.getLogger().
+_LOGGER_CACHE: dict[str, logging.Logger] = {}
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves all formatting to the listener thread.
+
+    The stock prepare() formats the record in the calling thread. This one
+    only copies it, so %-arguments are rendered when the listener emits the
+    record. Objects passed as arguments must not be mutated after logging.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
 
 def get_logger(name: str) -> logging.Logger:
     """Get a namespaced logger for an AdversaryPilot module.
@@ -13,7 +42,10 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    return logging.getLogger(name)
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = _LOGGER_CACHE.setdefault(name, logging.getLogger(name))
+    return logger
 
 
 def configure_logging(
@@ -22,13 +54,22 @@ def configure_logging(
 ) -> None:
     """Configure root AdversaryPilot logging.
 
+    Records are enqueued unformatted by the calling thread, then formatted
+    and written to stderr by a background listener, so logging never blocks
+    on formatting or I/O. The
+    listener is flushed and stopped at interpreter exit.
+
     Args:
         level: Logging level (default INFO)
         fmt: Log format string
     """
     logger = logging.getLogger("adversarypilot")
     if not logger.handlers:
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
         handler = logging.StreamHandler(sys.stderr)
         handler.setFormatter(logging.Formatter(fmt))
-        logger.addHandler(handler)
+        listener = logging.handlers.QueueListener(records, handler)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(_DeferredQueueHandler(records))
     logger.setLevel(level)
@@ -2,6 +2,8 @@
 
 from datetime import datetime, timezone
 
+_UTC = timezone.utc
+
 
 def utc_now() -> datetime:
     """Return current UTC time with timezone awareness.
@@ -12,4 +14,4 @@ def utc_now() -> datetime:
     Returns:
         datetime: Current UTC time with timezone info
     """
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
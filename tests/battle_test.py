@@ -4,15 +4,25 @@ AI red teaming workflows. Tests the FULL pipeline as a skeptical security
 engineer would use it.
 
 NOT unit tests. These are scenario-based validation tests.
+
+Each test works in its own tmp_path, and the only module state is the
+shared technique registry, which is never modified after loading. The
+tests are therefore independent and safe to run in parallel, e.g. with
+pytest-xdist's process-per-worker model.
 """
 
 from __future__ import annotations
 
 import json
+import logging
 import random
+import re
 import textwrap
+from operator import attrgetter
 from pathlib import Path
 
+import pytest
+
 from adversarypilot.campaign.manager import CampaignManager
 from adversarypilot.models.campaign import Campaign
 from adversarypilot.models.enums import (
@@ -27,9 +37,10 @@ from adversarypilot.models.enums import (
     TargetType,
 )
 from adversarypilot.models.plan import AttackPlan
-from adversarypilot.models.report import DefenderReport
+from adversarypilot.models.report import DefenderReport, LayerAssessment
 from adversarypilot.models.results import AttemptResult, ComparabilityMetadata, EvaluationResult
 from adversarypilot.models.target import ConstraintSpec, DefenseProfile, TargetProfile
+from adversarypilot.models.technique import AttackTechnique
 from adversarypilot.planner.adaptive import AdaptivePlanner
 from adversarypilot.planner.chains import ChainPlanner
 from adversarypilot.planner.diversity import FamilyTracker
@@ -43,6 +54,35 @@ from adversarypilot.reporting.html_renderer import HtmlReportRenderer
 from adversarypilot.reporting.renderer import ReportRenderer
 from adversarypilot.taxonomy.registry import TechniqueRegistry
 
+# Scenario narration goes to DEBUG with lazy %-args, so a normal pytest run
+# (root logger at WARNING) formats none of it
+logger = logging.getLogger(__name__)
+
+# <script src="..."> tags that pull code from a CDN
+_CDN_SCRIPT_RE = re.compile(r'<script[^>]+src=["\'][^"\']*cdn[^"\']*["\']', re.IGNORECASE)
+
+# Beta prior mean for prior strength k=8 at the worst-case base_score of 0.7
+_WORST_CASE_PRIOR_MEAN = (1.0 + 8.0 * 0.7) / (2.0 + 8.0)
+
+# The catalog is read-only once loaded, so every test shares one registry
+_REGISTRY: TechniqueRegistry | None = None
+
+
+def _get_registry() -> TechniqueRegistry:
+    """Load the technique catalog once per process."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        registry = TechniqueRegistry()
+        registry.load_catalog()
+        _REGISTRY = registry
+    return _REGISTRY
+
+
+@pytest.fixture(scope="session")
+def techniques_by_id() -> dict[str, AttackTechnique]:
+    """ID -> technique map for the shared registry (read-only)."""
+    return _get_registry().get_all_by_id()
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # REALISTIC TARGET PROFILES — modeled after real-world AI systems
@@ -146,8 +186,9 @@ def simulate_attack_results(
             attempts.append(AttemptResult(
                 id=attempt_id,
                 technique_id=entry.technique_id,
-                prompt=f"Simulated attack prompt for {entry.technique_name} (trial {trial})",
-                response=f"Simulated response (success={success})",
+                # Nothing inspects prompt/response text, so skip building it
+                prompt="sim",
+                response="sim",
                 source_tool="battle_test",
             ))
 
@@ -168,11 +209,23 @@ def simulate_attack_results(
     return attempts, evaluations
 
 
+def _success_flags(evals: list[EvaluationResult]) -> list[bool]:
+    """One flag per evaluation; inconclusive (None) counts as not successful."""
+    return [e.success is True for e in evals]
+
+
+def _primary_layer(assessments: list[LayerAssessment]) -> Surface | None:
+    """Layer of the highest-risk assessment with sufficient evidence, if any."""
+    sufficient = (a for a in assessments if not a.is_insufficient_evidence)
+    primary = max(sufficient, key=attrgetter("risk_score"), default=None)
+    return primary.layer if primary else None
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # TEST 1: FULL CAMPAIGN LIFECYCLE — Enterprise Chatbot
 # ═══════════════════════════════════════════════════════════════════════
 
-def test_full_campaign_lifecycle(tmp_path: Path):
+def test_full_campaign_lifecycle(tmp_path: Path, techniques_by_id: dict[str, AttackTechnique]):
     """
     Scenario: Red team assessing an enterprise chatbot.
     - Create adaptive campaign
@@ -190,6 +243,7 @@ def test_full_campaign_lifecycle(tmp_path: Path):
     planner = AdaptivePlanner(campaign_seed=42)
     manager = CampaignManager(
         storage_dir=storage_dir,
+        registry=_get_registry(),
         adaptive_planner=planner,
     )
     campaign = manager.create(
@@ -201,12 +255,12 @@ def test_full_campaign_lifecycle(tmp_path: Path):
     assert campaign.plan is not None
     assert len(campaign.plan.entries) > 0
     assert campaign.posterior_state is not None
-    print(f"\n{'='*70}")
-    print(f"CAMPAIGN CREATED: {campaign.id}")
-    print(f"  Target: {target.name}")
-    print(f"  Initial plan: {len(campaign.plan.entries)} techniques")
+    logger.debug("\n%s", "=" * 70)
+    logger.debug("CAMPAIGN CREATED: %s", campaign.id)
+    logger.debug("  Target: %s", target.name)
+    logger.debug("  Initial plan: %s techniques", len(campaign.plan.entries))
     for e in campaign.plan.entries[:5]:
-        print(f"    #{e.rank} {e.technique_name} (utility={e.score.utility:.3f})")
+        logger.debug("    #%s %s (utility=%.3f)", e.rank, e.technique_name, e.score.utility)
 
     # Step 2: Round 1 — initial attacks
     round1_plan = manager.recommend_next(
@@ -214,23 +268,28 @@ def test_full_campaign_lifecycle(tmp_path: Path):
     )
     assert len(round1_plan.entries) > 0
 
-    print(f"\nROUND 1 RECOMMENDATIONS ({len(round1_plan.entries)} techniques):")
+    logger.debug("\nROUND 1 RECOMMENDATIONS (%s techniques):", len(round1_plan.entries))
     for e in round1_plan.entries:
-        print(f"    #{e.rank} {e.technique_name} (utility={e.score.utility:.3f})")
-        print(f"          {e.rationale}")
+        logger.debug("    #%s %s (utility=%.3f)", e.rank, e.technique_name, e.score.utility)
+        logger.debug("          %s", e.rationale)
 
     # Simulate mostly-failing attacks (well-defended chatbot)
     attempts1, evals1 = simulate_attack_results(round1_plan, success_rate=0.15, seed=100)
     campaign = manager.ingest_results(campaign.id, attempts1, evals1)
 
-    successes = sum(1 for e in evals1 if e.success)
-    print(f"\n  Round 1 results: {successes}/{len(evals1)} succeeded")
+    # One pass over the results for both the success count and the tried IDs
+    successes = 0
+    tried_ids = set()
+    for e, a in zip(evals1, attempts1):
+        successes += e.success is True
+        tried_ids.add(a.technique_id)
+    logger.debug("\n  Round 1 results: %s/%s succeeded", successes, len(evals1))
 
-    # Verify posteriors were updated
-    for e in round1_plan.entries:
-        post = campaign.posterior_state.posteriors.get(e.technique_id)
-        if post:
-            assert post.observations > 0, f"{e.technique_id} should have observations"
+    # Verify posteriors were updated (KeyError if a tried technique has none)
+    posteriors = campaign.posterior_state.posteriors
+    for technique_id in tried_ids:
+        assert posteriors[technique_id].observations > 0, \
+            f"{technique_id} should have observations"
 
     # Step 3: Round 2 — adapted recommendations
     round2_plan = manager.recommend_next(
@@ -238,32 +297,29 @@ def test_full_campaign_lifecycle(tmp_path: Path):
         exclude_tried=True, adaptive=True,
     )
 
-    print(f"\nROUND 2 RECOMMENDATIONS (adapted, excluding tried):")
-    round1_ids = {e.technique_id for e in round1_plan.entries}
-    round2_ids = {e.technique_id for e in round2_plan.entries}
+    logger.debug("\nROUND 2 RECOMMENDATIONS (adapted, excluding tried):")
+    round1_ids = frozenset(e.technique_id for e in round1_plan.entries)
 
     # Round 2 should NOT repeat round 1 techniques (exclude_tried=True)
-    overlap = round1_ids & round2_ids
-    assert len(overlap) == 0, f"Round 2 repeated techniques from round 1: {overlap}"
+    repeats = [e.technique_id for e in round2_plan.entries if e.technique_id in round1_ids]
+    assert not repeats, f"Round 2 repeated techniques from round 1: {repeats}"
 
     for e in round2_plan.entries:
-        print(f"    #{e.rank} {e.technique_name} (utility={e.score.utility:.3f})")
-        print(f"          {e.rationale}")
+        logger.debug("    #%s %s (utility=%.3f)", e.rank, e.technique_name, e.score.utility)
+        logger.debug("          %s", e.rationale)
 
     # Simulate better success on adapted techniques
     attempts2, evals2 = simulate_attack_results(round2_plan, success_rate=0.4, seed=200)
     campaign = manager.ingest_results(campaign.id, attempts2, evals2)
 
-    successes2 = sum(1 for e in evals2 if e.success)
-    print(f"\n  Round 2 results: {successes2}/{len(evals2)} succeeded")
+    successes2 = _success_flags(evals2).count(True)
+    logger.debug("\n  Round 2 results: %s/%s succeeded", successes2, len(evals2))
 
     # Step 4: Generate defender report
-    techniques = {t.id: t for t in manager._registry.get_all()}
     analyzer = WeakestLayerAnalyzer()
-    assessments = analyzer.analyze(campaign.state.evaluations, techniques)
+    assessments = analyzer.analyze(campaign.state.evaluations, techniques_by_id)
 
-    sufficient = [a for a in assessments if not a.is_insufficient_evidence]
-    primary = max(sufficient, key=lambda a: a.risk_score).layer if sufficient else None
+    primary = _primary_layer(assessments)
 
     report = DefenderReport(
         target_profile=campaign.target,
@@ -275,21 +331,23 @@ def test_full_campaign_lifecycle(tmp_path: Path):
     assert len(assessments) > 0
     assert primary is not None
 
-    print(f"\nDEFENDER REPORT:")
-    print(f"  Primary weak layer: {primary.value}")
+    logger.debug("\nDEFENDER REPORT:")
+    logger.debug("  Primary weak layer: %s", primary.value)
     for a in assessments:
         if not a.is_insufficient_evidence:
-            print(f"  Layer {a.layer.value}: risk={a.risk_score:.2f}, "
-                  f"success_rate={a.evidence.smoothed_success_rate:.2f}")
+            logger.debug(
+                "  Layer %s: risk=%.2f, success_rate=%.2f",
+                a.layer.value, a.risk_score, a.evidence.smoothed_success_rate,
+            )
 
     # Verify the report has actionable recommendations
     all_recs = [r for a in assessments for r in a.recommendations]
     assert len(all_recs) > 0, "Report should contain recommendations"
-    print(f"  Recommendations: {len(all_recs)}")
+    logger.debug("  Recommendations: %s", len(all_recs))
     for r in all_recs[:3]:
-        print(f"    - {r}")
+        logger.debug("    - %s", r)
 
-    print(f"\n  VERDICT: Campaign lifecycle PASSED ✓")
+    logger.debug("\n  VERDICT: Campaign lifecycle PASSED ✓")
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -304,30 +362,32 @@ def test_rag_system_attack_chains(tmp_path: Path):
     - Verify chains have meaningful fallback strategies
     """
     target = make_rag_system()
-    registry = TechniqueRegistry()
-    registry.load_catalog()
+    registry = _get_registry()
 
     planner = ChainPlanner(registry, max_chain_length=5, max_chains=5)
     plan = AttackPlan(target=target, entries=[])
     chains = planner.plan_chains(target, plan)
 
-    print(f"\n{'='*70}")
-    print(f"RAG SYSTEM ATTACK CHAINS")
-    print(f"  Target: {target.name}")
-    print(f"  Goals: {[g.value for g in target.goals]}")
-    print(f"  Chains generated: {len(chains)}")
+    logger.debug("\n%s", "=" * 70)
+    logger.debug("RAG SYSTEM ATTACK CHAINS")
+    logger.debug("  Target: %s", target.name)
+    logger.debug("  Goals: %s", [g.value for g in target.goals])
+    logger.debug("  Chains generated: %s", len(chains))
 
     assert len(chains) > 0, "Should generate at least one chain"
 
     # Verify chains cover multiple goals
     goals_covered = {c.target_goal for c in chains}
-    print(f"  Goals covered: {[g.value for g in goals_covered]}")
+    logger.debug("  Goals covered: %s", [g.value for g in goals_covered])
 
     # Verify chains follow kill-chain ordering
     for chain in chains:
-        print(f"\n  Chain: {chain.name} ({len(chain.stages)} stages, cost={chain.total_cost:.2f})")
+        logger.debug(
+            "\n  Chain: %s (%s stages, cost=%.2f)",
+            chain.name, len(chain.stages), chain.total_cost,
+        )
         phases = chain.phase_sequence
-        print(f"    Phases: {' → '.join(p.value for p in phases)}")
+        logger.debug("    Phases: %s", " → ".join(p.value for p in phases))
 
         # Verify phases are in non-decreasing kill-chain order
         from adversarypilot.planner.chains import KILL_CHAIN_ORDER
@@ -338,15 +398,21 @@ def test_rag_system_attack_chains(tmp_path: Path):
         # Print stages
         for stage in chain.stages:
             fallbacks = f" [fallbacks: {', '.join(stage.fallback_techniques)}]" if stage.fallback_techniques else ""
-            print(f"    Stage {stage.stage_number}: {stage.technique_name} "
-                  f"({stage.phase.value}/{stage.surface.value}){fallbacks}")
+            logger.debug(
+                "    Stage %s: %s (%s/%s)%s",
+                stage.stage_number,
+                stage.technique_name,
+                stage.phase.value,
+                stage.surface.value,
+                fallbacks,
+            )
 
     # Verify surfaces are diverse
     all_surfaces = set()
     for chain in chains:
         for stage in chain.stages:
             all_surfaces.add(stage.surface)
-    print(f"\n  Surfaces covered: {[s.value for s in all_surfaces]}")
+    logger.debug("\n  Surfaces covered: %s", [s.value for s in all_surfaces])
     assert len(all_surfaces) >= 2, "Chains should cover multiple attack surfaces"
 
     # Verify fallbacks exist
@@ -354,16 +420,16 @@ def test_rag_system_attack_chains(tmp_path: Path):
         len(s.fallback_techniques) for c in chains for s in c.stages
     )
     assert total_fallbacks > 0, "At least some stages should have fallbacks"
-    print(f"  Total fallback techniques: {total_fallbacks}")
+    logger.debug("  Total fallback techniques: %s", total_fallbacks)
 
-    print(f"\n  VERDICT: RAG chain planning PASSED ✓")
+    logger.debug("\n  VERDICT: RAG chain planning PASSED ✓")
 
 
 # ═══════════════════════════════════════════════════════════════════════
 # TEST 3: AGENT SYSTEM — Tool misuse and exfil attack planning
 # ═══════════════════════════════════════════════════════════════════════
 
-def test_agent_system_comprehensive(tmp_path: Path):
+def test_agent_system_comprehensive(tmp_path: Path, techniques_by_id: dict[str, AttackTechnique]):
     """
     Scenario: Targeting an AI agent with MCP tools.
     - Verify agent-specific techniques are prioritized
@@ -376,6 +442,7 @@ def test_agent_system_comprehensive(tmp_path: Path):
     planner = AdaptivePlanner(campaign_seed=99)
     manager = CampaignManager(
         storage_dir=storage_dir,
+        registry=_get_registry(),
         adaptive_planner=planner,
     )
 
@@ -384,35 +451,33 @@ def test_agent_system_comprehensive(tmp_path: Path):
         adaptive=True, campaign_seed=99,
     )
 
-    print(f"\n{'='*70}")
-    print(f"AGENT SYSTEM ASSESSMENT")
-    print(f"  Target: {target.name}")
-    print(f"  Goals: {[g.value for g in target.goals]}")
-    print(f"  Initial plan: {len(campaign.plan.entries)} techniques")
+    logger.debug("\n%s", "=" * 70)
+    logger.debug("AGENT SYSTEM ASSESSMENT")
+    logger.debug("  Target: %s", target.name)
+    logger.debug("  Goals: %s", [g.value for g in target.goals])
+    logger.debug("  Initial plan: %s techniques", len(campaign.plan.entries))
 
     # Verify agent-specific techniques appear
     agent_techniques = [
         e for e in campaign.plan.entries
         if "AGT" in e.technique_id
     ]
-    print(f"  Agent-specific techniques in plan: {len(agent_techniques)}")
+    logger.debug("  Agent-specific techniques in plan: %s", len(agent_techniques))
     for e in agent_techniques:
-        print(f"    {e.technique_id}: {e.technique_name}")
+        logger.debug("    %s: %s", e.technique_id, e.technique_name)
 
     # Should have agent techniques for an agent target
     assert len(agent_techniques) > 0, \
         "Agent target should get agent-specific techniques"
 
     # Verify tool/action surfaces are targeted
-    registry = TechniqueRegistry()
-    registry.load_catalog()
-    plan_surfaces = set()
-    for e in campaign.plan.entries:
-        tech = registry.get(e.technique_id)
-        if tech:
-            plan_surfaces.add(tech.surface)
+    plan_surfaces = {
+        techniques_by_id[e.technique_id].surface
+        for e in campaign.plan.entries
+        if e.technique_id in techniques_by_id
+    }
 
-    print(f"  Attack surfaces targeted: {[s.value for s in plan_surfaces]}")
+    logger.debug("  Attack surfaces targeted: %s", [s.value for s in plan_surfaces])
 
     # For agent targets, should include tool or action surfaces
     agent_surfaces = {Surface.TOOL, Surface.ACTION}
@@ -429,9 +494,11 @@ def test_agent_system_comprehensive(tmp_path: Path):
             next_plan, success_rate=0.2 + round_num * 0.15, seed=round_num * 100,
         )
         manager.ingest_results(campaign.id, attempts, evals)
-        successes = sum(1 for e in evals if e.success)
-        print(f"  Round {round_num+1}: {successes}/{len(evals)} succeeded "
-              f"({len(next_plan.entries)} techniques)")
+        successes = _success_flags(evals).count(True)
+        logger.debug(
+            "  Round %s: %s/%s succeeded (%s techniques)",
+            round_num+1, successes, len(evals), len(next_plan.entries),
+        )
 
     # Verify campaign accumulated data correctly
     campaign = manager.get(campaign.id)
@@ -439,18 +506,18 @@ def test_agent_system_comprehensive(tmp_path: Path):
     assert len(campaign.state.evaluations) > 0
     assert len(campaign.state.techniques_tried) > 0
 
-    print(f"\n  Total attempts: {campaign.state.queries_used}")
-    print(f"  Techniques tried: {len(campaign.state.techniques_tried)}")
-    print(f"  Total evaluations: {len(campaign.state.evaluations)}")
+    logger.debug("\n  Total attempts: %s", campaign.state.queries_used)
+    logger.debug("  Techniques tried: %s", len(campaign.state.techniques_tried))
+    logger.debug("  Total evaluations: %s", len(campaign.state.evaluations))
 
-    print(f"\n  VERDICT: Agent system assessment PASSED ✓")
+    logger.debug("\n  VERDICT: Agent system assessment PASSED ✓")
 
 
 # ═══════════════════════════════════════════════════════════════════════
 # TEST 4: HTML REPORT QUALITY — Does the output look professional?
 # ═══════════════════════════════════════════════════════════════════════
 
-def test_html_report_quality(tmp_path: Path):
+def test_html_report_quality(tmp_path: Path, techniques_by_id: dict[str, AttackTechnique]):
     """
     Generate an HTML report from a real campaign and verify it contains:
     - Valid HTML structure
@@ -464,7 +531,9 @@ def test_html_report_quality(tmp_path: Path):
     storage_dir = tmp_path / "campaigns"
 
     planner = AdaptivePlanner(campaign_seed=42)
-    manager = CampaignManager(storage_dir=storage_dir, adaptive_planner=planner)
+    manager = CampaignManager(
+        storage_dir=storage_dir, registry=_get_registry(), adaptive_planner=planner,
+    )
     campaign = manager.create(target, name="html-report-test", adaptive=True, campaign_seed=42)
 
     # Run 2 rounds and ingest results
@@ -480,12 +549,10 @@ def test_html_report_quality(tmp_path: Path):
     campaign = manager.get(campaign.id)
 
     # Generate report
-    techniques = {t.id: t for t in manager._registry.get_all()}
     analyzer = WeakestLayerAnalyzer()
-    assessments = analyzer.analyze(campaign.state.evaluations, techniques)
+    assessments = analyzer.analyze(campaign.state.evaluations, techniques_by_id)
 
-    sufficient = [a for a in assessments if not a.is_insufficient_evidence]
-    primary = max(sufficient, key=lambda a: a.risk_score).layer if sufficient else None
+    primary = _primary_layer(assessments)
 
     report = DefenderReport(
         target_profile=campaign.target,
@@ -500,10 +567,10 @@ def test_html_report_quality(tmp_path: Path):
     renderer = HtmlReportRenderer()
     html = renderer.render(report, campaign, output_path=html_path)
 
-    print(f"\n{'='*70}")
-    print(f"HTML REPORT QUALITY AUDIT")
-    print(f"  Output: {html_path}")
-    print(f"  Size: {len(html):,} bytes")
+    logger.debug("\n%s", "=" * 70)
+    logger.debug("HTML REPORT QUALITY AUDIT")
+    logger.debug("  Output: %s", html_path)
+    logger.debug("  Size: %d bytes", len(html))
 
     # 1. Valid HTML structure
     assert html.startswith("<!DOCTYPE html>"), "Must start with DOCTYPE"
@@ -511,48 +578,49 @@ def test_html_report_quality(tmp_path: Path):
     assert "</html>" in html, "Missing closing </html> tag"
     assert "<head>" in html and "</head>" in html, "Missing head section"
     assert "<body>" in html and "</body>" in html, "Missing body section"
-    print(f"  ✓ Valid HTML structure")
+    logger.debug("  ✓ Valid HTML structure")
 
     # 2. Self-contained graph visualization (no CDN)
     assert "graph-canvas" in html, "Canvas graph element not found"
     assert "initGraph" in html, "Graph init function not found"
     # Verify no actual CDN <script src="...cdn..."> loading
-    import re as _re
-    cdn_script_tags = _re.findall(r'<script[^>]+src=["\'][^"\']*cdn[^"\']*["\']', html, _re.IGNORECASE)
+    cdn_script_tags = _CDN_SCRIPT_RE.findall(html)
     assert len(cdn_script_tags) == 0, \
         f"Should NOT load scripts from CDN — must be self-contained. Found: {cdn_script_tags}"
-    print(f"  ✓ Self-contained graph visualization (no CDN script tags)")
+    logger.debug("  ✓ Self-contained graph visualization (no CDN script tags)")
 
     # 3. Contains actual campaign data
     assert campaign.id in html, "Campaign ID not in HTML"
     assert "guardrail" in html.lower() or "model" in html.lower(), \
         "No attack surface data in HTML"
-    print(f"  ✓ Contains actual campaign data")
+    logger.debug("  ✓ Contains actual campaign data")
 
     # 4. Contains technique IDs (real data, not placeholder)
-    technique_ids_in_html = sum(1 for t in manager._registry.get_all() if t.id in html)
-    print(f"  ✓ {technique_ids_in_html} technique IDs found in HTML")
+    # One scan of the page for all IDs (no catalog ID is a substring of another)
+    technique_id_re = re.compile("|".join(map(re.escape, techniques_by_id)))
+    technique_ids_in_html = len(set(technique_id_re.findall(html)))
+    logger.debug("  ✓ %s technique IDs found in HTML", technique_ids_in_html)
     assert technique_ids_in_html > 0, "No technique IDs in HTML output"
 
     # 5. XSS protection present
     assert "function esc(text)" in html, "XSS escape function not found"
-    print(f"  ✓ XSS protection (esc function) present")
+    logger.debug("  ✓ XSS protection (esc function) present")
 
     # 6. Has interactive elements (tabs, buttons)
     has_tabs = "tab" in html.lower()
-    print(f"  ✓ Interactive elements present: tabs={has_tabs}")
+    logger.debug("  ✓ Interactive elements present: tabs=%s", has_tabs)
 
     # 7. File actually exists and is readable
     assert html_path.exists(), "HTML file not written"
     file_content = html_path.read_text()
     assert len(file_content) > 1000, "HTML file seems too small"
-    print(f"  ✓ File written and readable ({len(file_content):,} bytes)")
+    logger.debug("  ✓ File written and readable (%d bytes)", len(file_content))
 
     # 8. Contains DATA_JSON payload (the actual data)
     assert '"nodes"' in html, "Graph nodes data missing"
     assert '"edges"' in html, "Graph edges data missing"
     assert '"layers"' in html, "Layer assessment data missing"
-    print(f"  ✓ Graph data (nodes, edges, layers) embedded")
+    logger.debug("  ✓ Graph data (nodes, edges, layers) embedded")
 
     # 9. Check markdown report too
     md_renderer = ReportRenderer()
@@ -560,10 +628,10 @@ def test_html_report_quality(tmp_path: Path):
     assert "Defender Report" in md, "Markdown report missing header"
     assert target.name in md, "Markdown report missing target name"
     assert len(md) > 200, "Markdown report too short"
-    print(f"  ✓ Markdown report also valid ({len(md)} chars)")
+    logger.debug("  ✓ Markdown report also valid (%s chars)", len(md))
 
-    print(f"\n  VERDICT: HTML report quality PASSED ✓")
-    print(f"  Report saved: {html_path}")
+    logger.debug("\n  VERDICT: HTML report quality PASSED ✓")
+    logger.debug("  Report saved: %s", html_path)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -583,14 +651,15 @@ def test_replay_determinism(tmp_path: Path):
     planner = AdaptivePlanner(campaign_seed=42)
     manager = CampaignManager(
         storage_dir=storage_dir,
+        registry=_get_registry(),
         adaptive_planner=planner,
     )
     campaign = manager.create(
         target, name="replay-test", adaptive=True, campaign_seed=42,
     )
 
-    print(f"\n{'='*70}")
-    print(f"REPLAY DETERMINISM TEST")
+    logger.debug("\n%s", "=" * 70)
+    logger.debug("REPLAY DETERMINISM TEST")
 
     # Run 3 rounds
     plans = []
@@ -607,12 +676,11 @@ def test_replay_determinism(tmp_path: Path):
     # Now verify snapshots were recorded
     recorder = SnapshotRecorder(storage_dir)
     steps = recorder.list_snapshots(campaign.id)
-    print(f"  Snapshots recorded: {steps}")
+    logger.debug("  Snapshots recorded: %s", steps)
     assert len(steps) == 3, f"Expected 3 snapshots, got {len(steps)}"
 
     # Replay each step and verify
-    registry = TechniqueRegistry()
-    registry.load_catalog()
+    registry = _get_registry()
     replayer = DecisionReplayer(registry, AdaptivePlanner(campaign_seed=42))
 
     for step_num in steps:
@@ -621,28 +689,27 @@ def test_replay_determinism(tmp_path: Path):
 
         matches, divergences = replayer.verify(snapshot, target)
         status = "✓ MATCH" if matches else f"✗ DIVERGED: {divergences}"
-        print(f"  Step {step_num}: {status}")
+        logger.debug("  Step %s: %s", step_num, status)
         assert matches, f"Step {step_num} replay diverged: {divergences}"
 
-    print(f"\n  VERDICT: Replay determinism PASSED ✓")
+    logger.debug("\n  VERDICT: Replay determinism PASSED ✓")
 
 
 # ═══════════════════════════════════════════════════════════════════════
 # TEST 6: EDGE CASES AND STRESS TESTS
 # ═══════════════════════════════════════════════════════════════════════
 
-def test_edge_case_empty_results(tmp_path: Path):
+def test_edge_case_empty_results(tmp_path: Path, techniques_by_id: dict[str, AttackTechnique]):
     """Campaign with no attack results should still generate a report."""
     target = make_minimal_chatbot()
     storage_dir = tmp_path / "campaigns"
 
-    manager = CampaignManager(storage_dir=storage_dir)
+    manager = CampaignManager(storage_dir=storage_dir, registry=_get_registry())
     campaign = manager.create(target, name="empty-campaign")
 
     # Try to generate report with no results
-    techniques = {t.id: t for t in manager._registry.get_all()}
     analyzer = WeakestLayerAnalyzer()
-    assessments = analyzer.analyze([], techniques)
+    assessments = analyzer.analyze([], techniques_by_id)
 
     report = DefenderReport(
         target_profile=campaign.target,
@@ -652,7 +719,7 @@ def test_edge_case_empty_results(tmp_path: Path):
 
     # Should produce a report (all insufficient evidence)
     assert len(assessments) == 0 or all(a.is_insufficient_evidence for a in assessments)
-    print(f"\n  Edge case (empty results): PASSED ✓")
+    logger.debug("\n  Edge case (empty results): PASSED ✓")
 
 
 def test_edge_case_all_failures(tmp_path: Path):
@@ -661,7 +728,9 @@ def test_edge_case_all_failures(tmp_path: Path):
     storage_dir = tmp_path / "campaigns"
 
     planner = AdaptivePlanner(campaign_seed=42)
-    manager = CampaignManager(storage_dir=storage_dir, adaptive_planner=planner)
+    manager = CampaignManager(
+        storage_dir=storage_dir, registry=_get_registry(), adaptive_planner=planner,
+    )
     campaign = manager.create(target, name="all-fail", adaptive=True, campaign_seed=42)
 
     # Run 3 rounds, everything fails
@@ -673,7 +742,7 @@ def test_edge_case_all_failures(tmp_path: Path):
         manager.ingest_results(campaign.id, attempts, evals)
 
     campaign = manager.get(campaign.id)
-    assert all(not e.success for e in campaign.state.evaluations)
+    assert True not in _success_flags(campaign.state.evaluations)
 
     # Posteriors with observations should reflect failures
     # (posteriors with 0 observations were only initialized from V1 priors, never updated)
@@ -683,11 +752,10 @@ def test_edge_case_all_failures(tmp_path: Path):
         # With strong prior (k=8) and base_score around 0.5-0.7,
         # 9 failures (3 rounds × 3 trials) should push most below 0.5
         # but very high base_score priors may resist — check mean decreased from prior
-        initial_mean = (1.0 + 8.0 * 0.7) / (2.0 + 8.0)  # worst case base_score=0.7
-        assert post.mean < initial_mean, \
+        assert post.mean < _WORST_CASE_PRIOR_MEAN, \
             f"Posterior mean ({post.mean:.4f}) should have decreased after all failures"
 
-    print(f"  Edge case (all failures): PASSED ✓")
+    logger.debug("  Edge case (all failures): PASSED ✓")
 
 
 def test_edge_case_all_successes(tmp_path: Path):
@@ -696,7 +764,9 @@ def test_edge_case_all_successes(tmp_path: Path):
     storage_dir = tmp_path / "campaigns"
 
     planner = AdaptivePlanner(campaign_seed=42)
-    manager = CampaignManager(storage_dir=storage_dir, adaptive_planner=planner)
+    manager = CampaignManager(
+        storage_dir=storage_dir, registry=_get_registry(), adaptive_planner=planner,
+    )
     campaign = manager.create(target, name="all-success", adaptive=True, campaign_seed=42)
 
     next_plan = manager.recommend_next(
@@ -706,7 +776,7 @@ def test_edge_case_all_successes(tmp_path: Path):
     manager.ingest_results(campaign.id, attempts, evals)
 
     campaign = manager.get(campaign.id)
-    assert all(e.success for e in campaign.state.evaluations)
+    assert False not in _success_flags(campaign.state.evaluations)
 
     # Posteriors should reflect all successes
     for post in campaign.posterior_state.posteriors.values():
@@ -714,30 +784,31 @@ def test_edge_case_all_successes(tmp_path: Path):
             assert post.mean > 0.5, \
                 f"Posterior mean should be high after all successes: {post.mean}"
 
-    print(f"  Edge case (all successes): PASSED ✓")
+    logger.debug("  Edge case (all successes): PASSED ✓")
 
 
-def test_edge_case_whitebox_classifier(tmp_path: Path):
+def test_edge_case_whitebox_classifier(
+    tmp_path: Path, techniques_by_id: dict[str, AttackTechnique]
+):
     """White-box classifier — should get AML techniques."""
     target = make_whitebox_classifier()
-    registry = TechniqueRegistry()
-    registry.load_catalog()
+    registry = _get_registry()
     engine = PrioritizerEngine()
 
     plan = engine.plan(target, registry, max_techniques=10)
 
-    print(f"\n  White-box classifier plan ({len(plan.entries)} techniques):")
+    logger.debug("\n  White-box classifier plan (%s techniques):", len(plan.entries))
     aml_count = 0
     for e in plan.entries:
-        tech = registry.get(e.technique_id)
+        tech = techniques_by_id.get(e.technique_id)
         if tech and tech.domain == Domain.AML:
             aml_count += 1
-        print(f"    {e.technique_id}: {e.technique_name}")
+        logger.debug("    %s: %s", e.technique_id, e.technique_name)
 
     # Should include AML techniques for white-box classifier
     assert aml_count > 0, "White-box classifier plan should include AML techniques"
-    print(f"  AML techniques: {aml_count}")
-    print(f"  Edge case (white-box classifier): PASSED ✓")
+    logger.debug("  AML techniques: %s", aml_count)
+    logger.debug("  Edge case (white-box classifier): PASSED ✓")
 
 
 def test_edge_case_massive_campaign(tmp_path: Path):
@@ -746,7 +817,9 @@ def test_edge_case_massive_campaign(tmp_path: Path):
     storage_dir = tmp_path / "campaigns"
 
     planner = AdaptivePlanner(campaign_seed=42)
-    manager = CampaignManager(storage_dir=storage_dir, adaptive_planner=planner)
+    manager = CampaignManager(
+        storage_dir=storage_dir, registry=_get_registry(), adaptive_planner=planner,
+    )
     campaign = manager.create(target, name="stress-test", adaptive=True, campaign_seed=42)
 
     for round_num in range(10):
@@ -762,9 +835,9 @@ def test_edge_case_massive_campaign(tmp_path: Path):
     assert campaign.state.queries_used > 0
     assert len(campaign.state.evaluations) == 90  # 10 rounds × 3 techniques × 3 trials
 
-    print(f"  Stress test (10 rounds): PASSED ✓")
-    print(f"    Total evaluations: {len(campaign.state.evaluations)}")
-    print(f"    Techniques tried: {len(campaign.state.techniques_tried)}")
+    logger.debug("  Stress test (10 rounds): PASSED ✓")
+    logger.debug("    Total evaluations: %s", len(campaign.state.evaluations))
+    logger.debug("    Techniques tried: %s", len(campaign.state.techniques_tried))
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -780,11 +853,10 @@ def test_value_plan_quality(tmp_path: Path):
     - Access level filtering works
     - Defense-aware planning adjusts for known defenses
     """
-    print(f"\n{'='*70}")
-    print(f"VALUE ASSESSMENT — Is this tool worth using?")
+    logger.debug("\n%s", "=" * 70)
+    logger.debug("VALUE ASSESSMENT — Is this tool worth using?")
 
-    registry = TechniqueRegistry()
-    registry.load_catalog()
+    registry = _get_registry()
     engine = PrioritizerEngine()
 
     # Test 1: Enterprise chatbot (heavy defenses)
@@ -795,12 +867,12 @@ def test_value_plan_quality(tmp_path: Path):
     undefended_target = make_minimal_chatbot()
     undefended_plan = engine.plan(undefended_target, registry, max_techniques=5)
 
-    print(f"\n  Defended chatbot top techniques:")
+    logger.debug("\n  Defended chatbot top techniques:")
     for e in defended_plan.entries:
-        print(f"    #{e.rank} {e.technique_name} (score={e.score.total:.2f})")
-    print(f"\n  Undefended chatbot top techniques:")
+        logger.debug("    #%s %s (score=%.2f)", e.rank, e.technique_name, e.score.total)
+    logger.debug("\n  Undefended chatbot top techniques:")
     for e in undefended_plan.entries:
-        print(f"    #{e.rank} {e.technique_name} (score={e.score.total:.2f})")
+        logger.debug("    #%s %s (score=%.2f)", e.rank, e.technique_name, e.score.total)
 
     # The plans should be DIFFERENT — defenses should change rankings
     defended_ids = [e.technique_id for e in defended_plan.entries]
@@ -811,12 +883,12 @@ def test_value_plan_quality(tmp_path: Path):
     score_spread = max(defended_scores) - min(defended_scores)
     assert score_spread > 0.05, \
         f"Score spread too narrow ({score_spread:.3f}), not differentiating techniques"
-    print(f"\n  Score spread (defended): {score_spread:.3f}")
+    logger.debug("\n  Score spread (defended): %.3f", score_spread)
 
     # Rationales should be non-empty and descriptive
     for e in defended_plan.entries:
         assert len(e.rationale) > 10, f"Rationale too short for {e.technique_id}"
-    print(f"  ✓ All rationales are descriptive")
+    logger.debug("  ✓ All rationales are descriptive")
 
     # Test 3: Agent vs Chatbot — plans should differ
     agent_target = make_agent_system()
@@ -828,7 +900,7 @@ def test_value_plan_quality(tmp_path: Path):
     # Agent plan should have agent-specific techniques
     agent_specific = [tid for tid in agent_ids if "AGT" in tid]
     assert len(agent_specific) > 0, "Agent plan lacks agent-specific techniques"
-    print(f"  ✓ Agent plan has {len(agent_specific)} agent-specific techniques")
+    logger.debug("  ✓ Agent plan has %s agent-specific techniques", len(agent_specific))
 
     # Test 4: White-box vs Black-box — different technique selection
     bb_plan = engine.plan(
@@ -851,21 +923,21 @@ def test_value_plan_quality(tmp_path: Path):
 
     # White-box should include techniques that black-box cannot
     wb_only = wb_ids - bb_ids
-    print(f"  White-box-only techniques: {len(wb_only)}")
+    logger.debug("  White-box-only techniques: %s", len(wb_only))
     for tid in wb_only:
         tech = registry.get(tid)
         if tech:
-            print(f"    {tid} (requires {tech.access_required.value})")
+            logger.debug("    %s (requires %s)", tid, tech.access_required.value)
 
     # GCG requires white_box — should appear in WB but not BB
     gcg_in_wb = any("GCG" in tid for tid in wb_ids)
     gcg_in_bb = any("GCG" in tid for tid in bb_ids)
     if gcg_in_wb:
         assert not gcg_in_bb, "GCG (white-box-only) should not appear in black-box plan"
-        print(f"  ✓ Access level filtering works (GCG correctly filtered)")
+        logger.debug("  ✓ Access level filtering works (GCG correctly filtered)")
 
-    print(f"\n  VERDICT: Value assessment PASSED ✓")
-    print(f"  This tool provides differentiated, context-aware attack plans.")
+    logger.debug("\n  VERDICT: Value assessment PASSED ✓")
+    logger.debug("  This tool provides differentiated, context-aware attack plans.")
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -879,14 +951,16 @@ def test_thompson_sampling_convergence(tmp_path: Path):
     - Techniques that fail should get LOWER utility over time
     - This is the key differentiator vs static planning
     """
-    print(f"\n{'='*70}")
-    print(f"THOMPSON SAMPLING CONVERGENCE TEST")
+    logger.debug("\n%s", "=" * 70)
+    logger.debug("THOMPSON SAMPLING CONVERGENCE TEST")
 
     target = make_minimal_chatbot()
     storage_dir = tmp_path / "campaigns"
 
     planner = AdaptivePlanner(campaign_seed=42)
-    manager = CampaignManager(storage_dir=storage_dir, adaptive_planner=planner)
+    manager = CampaignManager(
+        storage_dir=storage_dir, registry=_get_registry(), adaptive_planner=planner,
+    )
     campaign = manager.create(
         target, name="convergence-test", adaptive=True, campaign_seed=42,
     )
@@ -901,8 +975,8 @@ def test_thompson_sampling_convergence(tmp_path: Path):
     # Pick the second technique and simulate it always failing
     losing_tech = initial_plan.entries[1].technique_id if len(initial_plan.entries) > 1 else None
 
-    print(f"  Winning technique: {winning_tech}")
-    print(f"  Losing technique: {losing_tech}")
+    logger.debug("  Winning technique: %s", winning_tech)
+    logger.debug("  Losing technique: %s", losing_tech)
 
     # Simulate 5 rounds: winning_tech always succeeds, losing_tech always fails
     for round_num in range(5):
@@ -934,15 +1008,19 @@ def test_thompson_sampling_convergence(tmp_path: Path):
     loser_post = campaign.posterior_state.posteriors.get(losing_tech) if losing_tech else None
 
     if winner_post and loser_post:
-        print(f"\n  After 5 rounds:")
-        print(f"    Winner posterior mean: {winner_post.mean:.3f} "
-              f"(α={winner_post.alpha:.1f}, β={winner_post.beta:.1f}, obs={winner_post.observations})")
-        print(f"    Loser posterior mean:  {loser_post.mean:.3f} "
-              f"(α={loser_post.alpha:.1f}, β={loser_post.beta:.1f}, obs={loser_post.observations})")
+        logger.debug("\n  After 5 rounds:")
+        logger.debug(
+            "    Winner posterior mean: %.3f (α=%.1f, β=%.1f, obs=%s)",
+            winner_post.mean, winner_post.alpha, winner_post.beta, winner_post.observations,
+        )
+        logger.debug(
+            "    Loser posterior mean:  %.3f (α=%.1f, β=%.1f, obs=%s)",
+            loser_post.mean, loser_post.alpha, loser_post.beta, loser_post.observations,
+        )
 
         assert winner_post.mean > loser_post.mean, \
             f"Winner ({winner_post.mean:.3f}) should have higher mean than loser ({loser_post.mean:.3f})"
-        print(f"  ✓ Thompson Sampling converged correctly")
+        logger.debug("  ✓ Thompson Sampling converged correctly")
 
     # Get final recommendations — winner should rank higher
     final_plan = manager.recommend_next(
@@ -953,13 +1031,13 @@ def test_thompson_sampling_convergence(tmp_path: Path):
     if winning_tech in final_rankings and losing_tech and losing_tech in final_rankings:
         winner_rank = final_rankings[winning_tech]
         loser_rank = final_rankings[losing_tech]
-        print(f"    Winner final rank: #{winner_rank}")
-        print(f"    Loser final rank:  #{loser_rank}")
+        logger.debug("    Winner final rank: #%s", winner_rank)
+        logger.debug("    Loser final rank:  #%s", loser_rank)
         assert winner_rank < loser_rank, \
             f"Winner (rank {winner_rank}) should rank above loser (rank {loser_rank})"
-        print(f"  ✓ Winning technique ranked higher after learning")
+        logger.debug("  ✓ Winning technique ranked higher after learning")
 
-    print(f"\n  VERDICT: Thompson Sampling convergence PASSED ✓")
+    logger.debug("\n  VERDICT: Thompson Sampling convergence PASSED ✓")
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -976,83 +1054,87 @@ def test_catalog_coverage():
     - Multiple access levels (black_box, gray_box, white_box)
     - Research-backed techniques with paper references
     """
-    print(f"\n{'='*70}")
-    print(f"CATALOG COVERAGE ASSESSMENT")
+    logger.debug("\n%s", "=" * 70)
+    logger.debug("CATALOG COVERAGE ASSESSMENT")
 
-    registry = TechniqueRegistry()
-    registry.load_catalog()
+    registry = _get_registry()
     all_techniques = registry.get_all()
 
-    print(f"  Total techniques: {len(all_techniques)}")
+    logger.debug("  Total techniques: %s", len(all_techniques))
 
     # Domain coverage
     domains = {}
     for t in all_techniques:
         domains.setdefault(t.domain, []).append(t)
-    print(f"\n  Domain breakdown:")
+    logger.debug("\n  Domain breakdown:")
     for d, techs in sorted(domains.items(), key=lambda x: x[0].value):
-        print(f"    {d.value}: {len(techs)} techniques")
+        logger.debug("    %s: %s techniques", d.value, len(techs))
     assert len(domains) >= 3, "Should cover at least 3 domains"
 
     # Phase coverage
     phases = set(t.phase for t in all_techniques)
-    print(f"\n  Phases covered: {sorted(p.value for p in phases)}")
+    logger.debug("\n  Phases covered: %s", sorted(p.value for p in phases))
     for required_phase in [Phase.RECON, Phase.PROBE, Phase.EXPLOIT]:
         assert required_phase in phases, f"Missing phase: {required_phase.value}"
-    print(f"  ✓ All critical phases covered")
+    logger.debug("  ✓ All critical phases covered")
 
     # Surface coverage
     surfaces = set(t.surface for t in all_techniques)
-    print(f"  Surfaces covered: {sorted(s.value for s in surfaces)}")
+    logger.debug("  Surfaces covered: %s", sorted(s.value for s in surfaces))
     for required_surface in [Surface.MODEL, Surface.GUARDRAIL, Surface.TOOL, Surface.DATA]:
         assert required_surface in surfaces, f"Missing surface: {required_surface.value}"
-    print(f"  ✓ All critical surfaces covered")
+    logger.debug("  ✓ All critical surfaces covered")
 
     # Access level coverage
     access_levels = set(t.access_required for t in all_techniques)
-    print(f"  Access levels: {sorted(a.value for a in access_levels)}")
+    logger.debug("  Access levels: %s", sorted(a.value for a in access_levels))
     assert AccessLevel.BLACK_BOX in access_levels
     assert AccessLevel.WHITE_BOX in access_levels
-    print(f"  ✓ Both black-box and white-box covered")
+    logger.debug("  ✓ Both black-box and white-box covered")
 
     # Goal coverage
     all_goals = set()
     for t in all_techniques:
         all_goals.update(t.goals_supported)
-    print(f"  Goals covered: {sorted(g.value for g in all_goals)}")
+    logger.debug("  Goals covered: %s", sorted(g.value for g in all_goals))
     for required_goal in [Goal.JAILBREAK, Goal.EXTRACTION, Goal.EXFIL_SIM,
                            Goal.TOOL_MISUSE, Goal.EVASION, Goal.POISONING]:
         assert required_goal in all_goals, f"Missing goal: {required_goal.value}"
-    print(f"  ✓ All critical goals covered")
+    logger.debug("  ✓ All critical goals covered")
 
     # Research-backed: at least 80% should have references
     with_refs = sum(1 for t in all_techniques if t.atlas_refs or t.other_refs)
     ref_pct = with_refs / len(all_techniques) * 100
-    print(f"\n  Techniques with references: {with_refs}/{len(all_techniques)} ({ref_pct:.0f}%)")
+    logger.debug(
+        "\n  Techniques with references: %s/%s (%.0f%%)",
+        with_refs, len(all_techniques), ref_pct,
+    )
     assert ref_pct >= 80, f"Only {ref_pct:.0f}% have references, need >=80%"
-    print(f"  ✓ {ref_pct:.0f}% research-backed")
+    logger.debug("  ✓ %.0f%% research-backed", ref_pct)
 
     # ATLAS coverage
     atlas_ids = set()
     for t in all_techniques:
         for ref in t.atlas_refs:
             atlas_ids.add(ref.atlas_id)
-    print(f"  MITRE ATLAS IDs referenced: {sorted(atlas_ids)}")
+    logger.debug("  MITRE ATLAS IDs referenced: %s", sorted(atlas_ids))
     assert len(atlas_ids) >= 3, "Should reference at least 3 ATLAS technique IDs"
-    print(f"  ✓ {len(atlas_ids)} ATLAS IDs referenced")
+    logger.debug("  ✓ %s ATLAS IDs referenced", len(atlas_ids))
 
     # Target type coverage
     target_types = set()
     for t in all_techniques:
         target_types.update(t.target_types)
-    print(f"  Target types: {sorted(tt.value for tt in target_types)}")
+    logger.debug("  Target types: %s", sorted(tt.value for tt in target_types))
     for required_tt in [TargetType.CHATBOT, TargetType.RAG, TargetType.AGENT, TargetType.CLASSIFIER]:
         assert required_tt in target_types, f"Missing target type: {required_tt.value}"
-    print(f"  ✓ All target types covered")
+    logger.debug("  ✓ All target types covered")
 
-    print(f"\n  VERDICT: Catalog coverage PASSED ✓")
-    print(f"  {len(all_techniques)} techniques across {len(domains)} domains, "
-          f"{len(phases)} phases, {len(surfaces)} surfaces")
+    logger.debug("\n  VERDICT: Catalog coverage PASSED ✓")
+    logger.debug(
+        "  %s techniques across %s domains, %s phases, %s surfaces",
+        len(all_techniques), len(domains), len(phases), len(surfaces),
+    )
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -1065,15 +1147,15 @@ def test_garak_integration():
 
     fixture = Path(__file__).parent / "fixtures" / "sample_garak_report.jsonl"
     if not fixture.exists():
-        print(f"  Garak fixture not found, skipping")
+        logger.debug("  Garak fixture not found, skipping")
         return
 
     importer = GarakImporter()
     results = importer.import_file(fixture)
 
-    print(f"\n{'='*70}")
-    print(f"GARAK INTEGRATION TEST")
-    print(f"  Imported: {len(results)} result pairs")
+    logger.debug("\n%s", "=" * 70)
+    logger.debug("GARAK INTEGRATION TEST")
+    logger.debug("  Imported: %s result pairs", len(results))
 
     assert len(results) > 0, "Should import at least one result"
 
@@ -1083,8 +1165,8 @@ def test_garak_integration():
         assert evaluation.attempt_id == attempt.id
 
     techniques_seen = set(a.technique_id for a, _ in results)
-    print(f"  Techniques mapped: {techniques_seen}")
-    print(f"  ✓ Garak integration works")
+    logger.debug("  Techniques mapped: %s", techniques_seen)
+    logger.debug("  ✓ Garak integration works")
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -1095,6 +1177,10 @@ if __name__ == "__main__":
     import tempfile
     import traceback
 
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+    # Only the scenario narration, not the library's own debug logs
+    logging.getLogger("adversarypilot").setLevel(logging.WARNING)
+
     print("=" * 70)
     print("  ADVERSARYPILOT BATTLE TEST SUITE")
     print("  Testing as a skeptical security engineer")
@@ -1126,10 +1212,12 @@ if __name__ == "__main__":
             with tempfile.TemporaryDirectory() as tmpdir:
                 import inspect
                 sig = inspect.signature(test_fn)
+                kwargs = {}
                 if "tmp_path" in sig.parameters:
-                    test_fn(Path(tmpdir))
-                else:
-                    test_fn()
+                    kwargs["tmp_path"] = Path(tmpdir)
+                if "techniques_by_id" in sig.parameters:
+                    kwargs["techniques_by_id"] = _get_registry().get_all_by_id()
+                test_fn(**kwargs)
             passed += 1
         except Exception as e:
             failed += 1
@@ -163,3 +163,11 @@ def test_utility_fields_populated(chatbot_target):
     for entry in plan.entries:
         assert entry.score.thompson_sample is not None
         assert entry.score.utility is not None
+
+
+def test_default_config_not_shared_between_planners():
+    """Mutating one planner's config leaves other planners untouched."""
+    first = AdaptivePlanner(campaign_seed=1)
+    first.config["adaptive"]["prior_strength"] = -1.0
+    second = AdaptivePlanner(campaign_seed=2)
+    assert second.config["adaptive"]["prior_strength"] == 3.0
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from adversarypilot.campaign.manager import CampaignManager
 from adversarypilot.models.enums import CampaignStatus
 
@@ -49,6 +51,38 @@ def test_ingest_results(chatbot_target, sample_results, tmp_path):
     assert len(updated.state.techniques_tried) == 1
 
 
+def test_ingest_results_many_matches_sequential(chatbot_target, sample_results, tmp_path):
+    batches = [sample_results[:2], sample_results[2:]]
+
+    sequential = CampaignManager(storage_dir=tmp_path / "seq")
+    campaign = sequential.create(chatbot_target)
+    for batch in batches:
+        expected = sequential.ingest_results(
+            campaign.id, [a for a, _ in batch], [e for _, e in batch]
+        )
+
+    batched = CampaignManager(storage_dir=tmp_path / "batch")
+    campaign = batched.create(chatbot_target)
+    updated = batched.ingest_results_many(
+        campaign.id,
+        [[a for a, _ in batch] for batch in batches],
+        [[e for _, e in batch] for batch in batches],
+    )
+    assert updated.total_attempts == expected.total_attempts == 5
+    assert updated.successful_attempts == expected.successful_attempts
+    assert updated.state.techniques_tried == expected.state.techniques_tried
+
+    reloaded = CampaignManager(storage_dir=tmp_path / "batch").get(campaign.id)
+    assert reloaded.total_attempts == 5
+
+
+def test_ingest_results_many_rejects_mismatched_batches(chatbot_target, tmp_path):
+    manager = CampaignManager(storage_dir=tmp_path)
+    campaign = manager.create(chatbot_target)
+    with pytest.raises(ValueError, match="batches"):
+        manager.ingest_results_many(campaign.id, [[]], [])
+
+
 def test_recommend_next(chatbot_target, sample_results, tmp_path):
     manager = CampaignManager(storage_dir=tmp_path)
     campaign = manager.create(chatbot_target)
@@ -257,6 +257,60 @@ def test_cli_report_generates_markdown_and_html(tmp_path: Path, chatbot_target,
     assert "<html" in contents.lower()
 
 
+def test_cli_report_rejects_empty_sections(tmp_path: Path, chatbot_target):
+    storage_dir = tmp_path / "campaigns"
+    campaign = CampaignManager(storage_dir=storage_dir).create(chatbot_target)
+
+    html_out = tmp_path / "report.html"
+    result = runner.invoke(
+        app,
+        [
+            "report",
+            campaign.id,
+            "--dir",
+            str(storage_dir),
+            "--format",
+            "html",
+            "--output",
+            str(html_out),
+            "--sections",
+            ",",
+        ],
+    )
+    assert result.exit_code != 0
+    assert "--sections" in result.output
+    assert not html_out.exists()
+
+
+@pytest.mark.parametrize(
+    ("extra_args", "message"),
+    [
+        ([], "requires --output"),
+        (["--output", "report.html", "--sections", "graph,bogus"], "--sections"),
+    ],
+)
+def test_cli_report_validates_html_options_before_rendering(
+    tmp_path: Path, chatbot_target, monkeypatch, extra_args, message
+):
+    from adversarypilot.reporting.html_renderer import HtmlReportRenderer
+
+    def fail_render(*args, **kwargs):
+        raise AssertionError("render() called for an invalid invocation")
+
+    monkeypatch.setattr(HtmlReportRenderer, "render", fail_render)
+    monkeypatch.chdir(tmp_path)
+    storage_dir = tmp_path / "campaigns"
+    campaign = CampaignManager(storage_dir=storage_dir).create(chatbot_target)
+
+    result = runner.invoke(
+        app,
+        ["report", campaign.id, "--dir", str(storage_dir), "--format", "html", *extra_args],
+    )
+    assert result.exit_code != 0
+    assert message in result.output
+    assert not (tmp_path / "report.html").exists()
+
+
 def test_cli_report_missing_campaign(tmp_path: Path):
     storage_dir = tmp_path / "campaigns"
 
@@ -1,5 +1,9 @@
 """Tests for HTML report renderer."""
 
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
 import pytest
 
 from adversarypilot.models.campaign import Campaign, CampaignState
@@ -16,7 +20,7 @@ from adversarypilot.models.report import (
 )
 from adversarypilot.models.results import ComparabilityMetadata, EvaluationResult
 from adversarypilot.models.target import TargetProfile
-from adversarypilot.reporting.html_renderer import HtmlReportRenderer
+from adversarypilot.reporting.html_renderer import HtmlReportRenderer, _json_default
 
 
 @pytest.fixture
@@ -103,6 +107,64 @@ class TestHtmlReportRenderer:
         content = output.read_text()
         assert content == html
 
+    def test_writes_to_file_without_returning_string(self, report, campaign, tmp_path):
+        renderer = HtmlReportRenderer()
+        output = tmp_path / "report.html"
+        result = renderer.render(report, campaign, output_path=output, return_str=False)
+        assert result is None
+        content = output.read_text()
+        assert content.startswith("<!DOCTYPE html>")
+        assert "{{DATA_JSON}}" not in content
+        assert "test-campaign" in content
+
+    @pytest.mark.parametrize("pretty", [False, True])
+    def test_streamed_file_matches_returned_string(self, report, campaign, tmp_path, pretty):
+        report.campaign_id = "</script><script>alert('xss')</script>"
+        renderer = HtmlReportRenderer()
+        output = tmp_path / "report.html"
+        html = renderer.render(report, campaign, pretty=pretty)
+        renderer.render(report, campaign, output_path=output, return_str=False, pretty=pretty)
+        assert output.read_text(encoding="utf-8") == html
+
+    def test_payload_is_compact_by_default(self, report, campaign):
+        renderer = HtmlReportRenderer()
+        compact = renderer.render(report, campaign)
+        pretty = renderer.render(report, campaign, pretty=True)
+        assert '"campaign_id":"test-campaign"' in compact
+        assert '"campaign_id": "test-campaign"' in pretty
+        assert len(compact) < len(pretty)
+
+    def test_sections_limit_payload(self, report, campaign):
+        renderer = HtmlReportRenderer()
+        data = renderer._build_data_payload(report, campaign, sections={"statistics"})
+        assert data["report"]["campaign_id"] == "test-campaign"
+        assert data["statistics"]["total_attempts"] == 1
+        assert data["graph"] is None
+        assert data["heatmap"] is None
+        assert data["techniques"] is None
+
+    def test_unknown_section_rejected(self, report, campaign):
+        renderer = HtmlReportRenderer()
+        with pytest.raises(ValueError, match="bogus"):
+            renderer.render(report, campaign, sections={"bogus"})
+
+    def test_generated_at_is_iso_formatted(self, report, campaign):
+        renderer = HtmlReportRenderer()
+        html = renderer.render(report, campaign)
+        assert f'"generated_at":"{report.generated_at.isoformat()}"' in html
+
+    def test_json_default_writes_datetimes_as_iso(self):
+        stamp = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert json.dumps({"at": stamp}, default=_json_default) == (
+            '{"at": "2025-01-02T03:04:05+00:00"}'
+        )
+        assert json.dumps({"p": Path("a")}, default=_json_default) == '{"p": "a"}'
+
+    def test_embedded_css_is_minified(self, report, campaign):
+        html = HtmlReportRenderer().render(report, campaign)
+        assert "/* Header */" not in html
+        assert ":root{--bg-primary:#0d1117;" in html
+
     def test_escapes_html_in_data(self, report, campaign):
         # Inject potential XSS in campaign_id
         report.campaign_id = "<script>alert('xss')</script>"
@@ -110,3 +172,55 @@ class TestHtmlReportRenderer:
         html = renderer.render(report, campaign)
         # The esc() function in the template prevents XSS at render time
         assert "function esc(text)" in html
+        # and the embedded JSON cannot terminate its <script> block early
+        assert "alert('xss')</script>" not in html
+        assert "alert('xss')<\\/script>" in html
+
+
+class TestBuildGraph:
+    @staticmethod
+    def _tech(tech_id, phase, atlas_refs):
+        return {
+            "id": tech_id, "name": tech_id, "domain": "llm", "surface": "guardrail",
+            "layer": "guardrail", "phase": phase, "success": None, "score": None,
+            "atlas_refs": atlas_refs,
+        }
+
+    def test_edges_follow_phase_order_and_smallest_shared_atlas(self):
+        renderer = HtmlReportRenderer()
+        graph = renderer._build_graph([
+            self._tech("A", "exploit", ["AML.T0054", "AML.T0051"]),
+            self._tech("B", "recon", ["AML.T0051", "AML.T0054"]),
+            self._tech("C", "probe", ["AML.T0099"]),
+        ])
+        assert len(graph["nodes"]) == 3
+        assert graph["edges"] == [
+            {"id": "edge-0", "source": "B", "target": "A", "atlas_id": "AML.T0051"},
+        ]
+
+
+class TestBestEvaluationIndex:
+    @staticmethod
+    def _eval(attempt_id, tech_id, success, score):
+        return EvaluationResult(
+            attempt_id=attempt_id,
+            success=success,
+            score=score,
+            comparability=ComparabilityMetadata(technique_id=tech_id),
+        )
+
+    def test_prefers_success_then_highest_score(self, target):
+        campaign = Campaign(
+            id="c",
+            target=target,
+            state=CampaignState(evaluations=[
+                self._eval("a1", "T1", False, 0.9),
+                self._eval("a2", "T1", True, 0.2),
+                self._eval("a3", "T1", True, 0.7),
+                self._eval("a4", "T2", None, 0.1),
+            ]),
+        )
+        index = HtmlReportRenderer()._index_best_evaluations(campaign)
+        assert index["T1"].attempt_id == "a3"
+        assert index["T2"].attempt_id == "a4"
+        assert "T3" not in index
@@ -1,7 +1,11 @@
 """Tests for technique registry."""
 
+import json
+
+import yaml
+
 from adversarypilot.models.enums import AccessLevel, Domain, Goal, Surface, TargetType
-from adversarypilot.taxonomy.registry import TechniqueRegistry
+from adversarypilot.taxonomy.registry import _DEFAULT_CATALOG, TechniqueRegistry
 
 
 def test_load_catalog(registry):
@@ -80,3 +84,45 @@ def test_atlas_refs_present(registry):
     t = registry.get("AP-TX-LLM-JAILBREAK-DAN")
     assert len(t.atlas_refs) > 0
     assert t.atlas_refs[0].atlas_id == "AML.T0051"
+
+
+def test_get_all_by_id_is_cached_until_reload(registry):
+    by_id = registry.get_all_by_id()
+    assert len(by_id) == len(registry)
+    assert by_id["AP-TX-LLM-JAILBREAK-DAN"].name == "DAN-style Jailbreak"
+    assert registry.get_all_by_id() is by_id
+
+    registry.load_catalog()
+    assert registry.get_all_by_id() is not by_id
+
+
+def test_filter_matches_linear_scan_in_catalog_order(registry):
+    expected = [
+        t for t in registry.get_all()
+        if t.domain == Domain.LLM
+        and Goal.JAILBREAK in t.goals_supported
+        and t.access_required == AccessLevel.BLACK_BOX
+    ]
+    results = registry.filter(
+        domain=Domain.LLM, goal=Goal.JAILBREAK, access_level=AccessLevel.BLACK_BOX
+    )
+    assert [t.id for t in results] == [t.id for t in expected]
+
+
+def test_filter_by_framework(registry):
+    owasp = registry.filter(framework="owasp_llm_top10")
+    assert len(owasp) > 0
+    assert all(
+        any(ref.framework == "owasp_llm_top10" for ref in t.compliance_refs)
+        for t in owasp
+    )
+    assert registry.filter(framework="no_such_framework") == []
+
+
+def test_load_json_catalog(tmp_path):
+    json_catalog = tmp_path / "catalog.json"
+    json_catalog.write_text(json.dumps(yaml.safe_load(_DEFAULT_CATALOG.read_text())))
+    reg = TechniqueRegistry()
+    reg.load_catalog(json_catalog)
+    assert len(reg) == 70
+    assert reg.get("AP-TX-LLM-JAILBREAK-DAN").name == "DAN-style Jailbreak"
@@ -1,5 +1,7 @@
 """Tests for trust package — audit trail, reproducibility, assessment quality (WS3)."""
 
+import hashlib
+
 import pytest
 
 from adversarypilot.models.enums import AccessLevel, Goal, Surface, TargetType
@@ -193,6 +195,12 @@ class TestHashFile:
         p2.write_text("world")
         assert hash_file(str(p1)) != hash_file(str(p2))
 
+    def test_large_file_matches_sha256(self, tmp_path):
+        p = tmp_path / "big.bin"
+        data = b"x" * (2 << 20)
+        p.write_bytes(data)
+        assert hash_file(str(p)) == hashlib.sha256(data).hexdigest()[:16]
+
 
 class TestReproducibilityToken:
     def test_compute_token(self):
@@ -4,6 +4,7 @@ from adversarypilot.models.enums import Goal, JudgeType, TargetType
 from adversarypilot.models.target import TargetProfile
 from adversarypilot.utils.hashing import (
     derive_comparable_group_key,
+    derive_comparable_group_keys,
     hash_success_criteria,
     hash_target_profile,
     hash_technique_config,
@@ -89,3 +90,45 @@ def test_derive_comparable_group_key_missing_fields():
 
     key = derive_comparable_group_key(comp)
     assert key == ""
+
+
+def test_derive_comparable_group_keys_matches_single():
+    """Batch derivation matches per-item keys, in input order."""
+    from adversarypilot.models.results import ComparabilityMetadata
+
+    items = [
+        ComparabilityMetadata(
+            target_profile_hash="t",
+            technique_config_hash=tech,
+            success_criteria_hash="c",
+            judge_type=JudgeType.RULE_BASED,
+        )
+        for tech in ("a", "b", "a")
+    ]
+    items.append(ComparabilityMetadata(technique_config_hash="a"))
+
+    keys = derive_comparable_group_keys(items)
+    assert keys == [derive_comparable_group_key(c) for c in items]
+    assert keys[0] == keys[2] != keys[1]
+    assert keys[3] == ""
+
+
+def test_hashes_are_stable_across_releases():
+    """Group keys are persisted, so digests must not drift."""
+    target = TargetProfile(
+        name="Target1",
+        target_type=TargetType.CHATBOT,
+        access_level="black_box",
+        goals=[Goal.JAILBREAK, Goal.EXTRACTION],
+    )
+    assert hash_target_profile(target) == "90dedd8ddfa948fb"
+    assert hash_technique_config("AP-TX-LLM-JAILBREAK-DAN") == "ddd2743cbd829c89"
+    assert (
+        hash_success_criteria(JudgeType.LLM_JUDGE, {"threshold": 0.5, "model": "x", "ignored": 1})
+        == "990059d051e8c5f5"
+    )
+
+
+def test_derive_comparable_group_keys_rejects_non_metadata():
+    """Batch derivation checks types before reading fields, like the single form."""
+    assert derive_comparable_group_keys([object()]) == [""]  # type: ignore[list-item]
@@ -0,0 +1,22 @@
+"""Tests for logging utilities."""
+
+import logging
+import queue
+
+from adversarypilot.utils.logging import _DeferredQueueHandler
+
+
+def test_deferred_queue_handler_does_not_format():
+    """Enqueued records keep their arguments for the listener to format."""
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handler = _DeferredQueueHandler(records)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    record = logging.LogRecord("adversarypilot", logging.INFO, __file__, 1, "n=%d", (3,), None)
+
+    handler.emit(record)
+    queued = records.get_nowait()
+
+    assert queued is not record
+    assert (queued.msg, queued.args) == ("n=%d", (3,))
+    assert not hasattr(queued, "message")
+    assert logging.Formatter("%(message)s").format(queued) == "n=3"